@@ -7,11 +7,13 @@ import re
 import sys
 from pathlib import Path
 
+VERSION_RE = re.compile(r'version="(\d+\.\d+\.\d+)"')
+
 
 def get_current_version(setup_file: Path) -> str:
     """Extract current version from setup.py"""
     content = setup_file.read_text(encoding="utf-8")
-    match = re.search(r'version="(\d+\.\d+\.\d+)"', content)
+    match = VERSION_RE.search(content)
     if not match:
         raise ValueError("Could not find version in setup.py")
     return match.group(1)
@@ -39,11 +41,11 @@ def bump_version(version: str, part: str) -> str:
 def update_version_in_file(setup_file: Path, old_version: str, new_version: str):
     """Update version in setup.py"""
     content = setup_file.read_text(encoding="utf-8")
-    new_content = content.replace(
-        f'version="{old_version}"',
-        f'version="{new_version}"'
-    )
-    setup_file.write_text(new_content, encoding="utf-8")
+    # Only the first occurrence is the package version
+    before, found, after = content.partition(f'version="{old_version}"')
+    if not found:
+        raise ValueError(f"Could not find version {old_version} in {setup_file.name}")
+    setup_file.write_text(f'{before}version="{new_version}"{after}', encoding="utf-8")
 
 
 def main():
@@ -13,18 +13,19 @@ from rich.spinner import Spinner
 from rich.table import Table
 from noless.art import AGENT_ICONS
 from noless.ollama_client import OllamaClient
+from noless.json_utils import loads as json_loads
 
 
 def _parse_json_block(payload: str) -> Optional[Dict[str, Any]]:
     if not payload:
         return None
     try:
-        return json.loads(payload)
+        return json_loads(payload)
     except json.JSONDecodeError:
         match = re.search(r"\{.*\}", payload, re.DOTALL)
         if match:
             try:
-                return json.loads(match.group())
+                return json_loads(match.group())
             except json.JSONDecodeError:
                 return None
     return None
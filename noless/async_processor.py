@@ -1,30 +1,147 @@
 """Async utilities for parallel processing of LLM and API calls."""
 
 import asyncio
-from typing import List, Dict, Optional, Any, Callable, TypeVar, Awaitable
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import os
+import threading
+from typing import List, Optional, Any, Callable, TypeVar, Awaitable, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import time
-from functools import wraps
+from functools import partial, wraps
 
 T = TypeVar("T")
 
+_default_executor: Optional[ThreadPoolExecutor] = None
+_default_executor_lock = threading.Lock()
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_default_executor(max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """Get or create the process-wide thread pool shared by processors.
+
+    Args:
+        max_workers: Pool size, honored only by the call that creates the
+            pool (default: CPython's ThreadPoolExecutor heuristic)
+    """
+    global _default_executor
+    if _default_executor is None:
+        with _default_executor_lock:
+            if _default_executor is None:
+                if max_workers is None:
+                    # Same sizing heuristic CPython uses for ThreadPoolExecutor
+                    max_workers = min(32, (os.cpu_count() or 1) + 4)
+                _default_executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="noless-worker",
+                )
+    return _default_executor
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get or create the process-wide pool for CPU-bound work.
+
+    Workers are spawned rather than forked, which is safe alongside the
+    background event loop thread and behaves the same on every platform.
+    Their startup cost is paid once and amortized over later submissions.
+    As with any spawn-based pool, scripts that end up using it need an
+    ``if __name__ == "__main__":`` guard.
+    """
+    global _process_pool
+    if _process_pool is None:
+        with _default_executor_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _process_pool
+
+
+def process_map(fn: Callable[[T], Any], items: List[T], chunksize: int = 1) -> List[Any]:
+    """Map fn over items on the shared process pool, in input order.
+
+    If the pool's workers can't start, which is what happens when a script
+    without an ``if __name__ == "__main__":`` guard reaches the pool, the
+    items are mapped in the calling process instead.
+    """
+    try:
+        return list(get_process_pool().map(fn, items, chunksize=chunksize))
+    except BrokenProcessPool:
+        return [fn(item) for item in items]
+
+
+# (results in input order with None for failures, [(index, exception), ...])
+SplitResults = Tuple[List[Any], List[Tuple[int, BaseException]]]
+
+
+async def gather_split(awaitables: List[Awaitable[Any]]) -> SplitResults:
+    """
+    Await all awaitables concurrently, separating results from failures.
+
+    Args:
+        awaitables: Awaitables to run
+
+    Returns:
+        Tuple of (results, errors). results is aligned with awaitables and
+        holds None where a call failed; errors lists (index, exception).
+    """
+    results: List[Any] = [None] * len(awaitables)
+    errors: List[Tuple[int, BaseException]] = []
+
+    async def capture(index: int, awaitable: Awaitable[Any]) -> None:
+        try:
+            results[index] = await awaitable
+        except Exception as exc:
+            errors.append((index, exc))
+
+    wrapped = [capture(i, aw) for i, aw in enumerate(awaitables)]
+    if hasattr(asyncio, "TaskGroup"):
+        async with asyncio.TaskGroup() as tg:
+            for coro in wrapped:
+                tg.create_task(coro)
+    else:
+        await asyncio.gather(*wrapped)
+
+    errors.sort(key=lambda item: item[0])
+    return results, errors
+
 
 class AsyncProcessor:
     """Handles parallel processing of tasks."""
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, executor: Optional[ThreadPoolExecutor] = None):
         """
         Initialize async processor.
 
         Args:
-            max_workers: Maximum number of concurrent workers
+            max_workers: Maximum number of concurrent workers; sizes the shared
+                pool only if this processor is the one that creates it
+            executor: Executor for blocking work (default: shared process-wide pool)
         """
         self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.executor = executor if executor is not None else get_default_executor(max_workers)
+        self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_thread: Optional[threading.Thread] = None
+        self._bg_lock = threading.Lock()
+
+    def _get_bg_loop(self) -> asyncio.AbstractEventLoop:
+        """Start (once) and return a long-lived event loop on a daemon thread."""
+        if self._bg_loop is None:
+            with self._bg_lock:
+                if self._bg_loop is None:
+                    loop = asyncio.new_event_loop()
+                    thread = threading.Thread(
+                        target=loop.run_forever, name="noless-async", daemon=True
+                    )
+                    thread.start()
+                    self._bg_thread = thread
+                    self._bg_loop = loop
+        return self._bg_loop
 
     async def map_async(
         self, async_fn: Callable[[T], Awaitable[Any]], items: List[T]
-    ) -> List[Any]:
+    ) -> SplitResults:
         """
         Execute async function on all items in parallel.
 
@@ -33,16 +150,18 @@ class AsyncProcessor:
             items: Items to process
 
         Returns:
-            List of results in same order as items
+            Tuple of (results in same order as items, [(index, exception)])
         """
-        tasks = [async_fn(item) for item in items]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        return await gather_split([async_fn(item) for item in items])
 
     async def batch_async(
         self, async_fn: Callable[[T], Awaitable[Any]], items: List[T], batch_size: int = 3
-    ) -> List[Any]:
+    ) -> SplitResults:
         """
-        Execute async function with batching for rate limiting.
+        Execute async function with a bounded number of in-flight calls.
+
+        A new item starts as soon as any running one finishes, so one slow
+        item never stalls the rest of its "batch".
 
         Args:
             async_fn: Async function to apply
@@ -50,16 +169,15 @@ class AsyncProcessor:
             batch_size: Max concurrent operations
 
         Returns:
-            List of results
+            Tuple of (results in same order as items, [(index, exception)])
         """
-        results = []
-        for i in range(0, len(items), batch_size):
-            batch = items[i : i + batch_size]
-            batch_results = await self.map_async(async_fn, batch)
-            results.extend(batch_results)
-            if i + batch_size < len(items):
-                await asyncio.sleep(0.1)  # Small delay between batches
-        return results
+        sem = asyncio.Semaphore(batch_size)
+
+        async def run(item: T) -> Any:
+            async with sem:
+                return await async_fn(item)
+
+        return await self.map_async(run, items)
 
     def run_sync(self, async_fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
         """
@@ -74,49 +192,77 @@ class AsyncProcessor:
             Function result
         """
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # We're already in an async context, use thread executor
-                future = loop.run_in_executor(
-                    self.executor, lambda: asyncio.run(async_fn(*args, **kwargs))
-                )
-                return asyncio.wait(future)
-            else:
-                return loop.run_until_complete(async_fn(*args, **kwargs))
+            asyncio.get_running_loop()
         except RuntimeError:
-            # No event loop exists, create one
+            # No loop in this thread, run to completion directly
             return asyncio.run(async_fn(*args, **kwargs))
 
+        # Called from inside a running loop: we can't block it, so dispatch
+        # to the shared background loop and wait on the thread-safe future.
+        future = asyncio.run_coroutine_threadsafe(
+            async_fn(*args, **kwargs), self._get_bg_loop()
+        )
+        return future.result()
+
     def shutdown(self) -> None:
-        """Shutdown executor."""
-        self.executor.shutdown(wait=True)
+        """Shutdown executor and background loop.
+
+        The shared default executor is left running for other processors.
+        """
+        if self._bg_loop is not None:
+            self._bg_loop.call_soon_threadsafe(self._bg_loop.stop)
+            self._bg_thread.join()
+            self._bg_loop.close()
+            self._bg_loop = None
+            self._bg_thread = None
+        if self.executor is not _default_executor:
+            self.executor.shutdown(wait=True)
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls."""
+    """Token-bucket rate limiter for API calls."""
 
-    def __init__(self, calls_per_second: float = 1.0):
+    def __init__(self, calls_per_second: float = 1.0, capacity: Optional[float] = None):
         """
         Initialize rate limiter.
 
         Args:
-            calls_per_second: Maximum calls per second
+            calls_per_second: Sustained calls per second (token refill rate)
+            capacity: Maximum burst size (default: one second's worth of calls)
         """
         self.calls_per_second = calls_per_second
         self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0.0
-        self.lock = asyncio.Lock()
+        self.capacity = capacity if capacity is not None else max(1.0, calls_per_second)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last_refill) * self.calls_per_second,
+            )
+            self.last_refill = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            # Bucket is in debt: this caller's slot opens once it refills
+            return -self.tokens / self.calls_per_second
 
     async def acquire(self) -> None:
         """Wait until it's safe to make another call."""
-        async with self.lock:
-            now = time.time()
-            time_since_last_call = now - self.last_call
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
 
-            if time_since_last_call < self.min_interval:
-                await asyncio.sleep(self.min_interval - time_since_last_call)
-
-            self.last_call = time.time()
+    def acquire_sync(self) -> None:
+        """Blocking variant of acquire for synchronous callers."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
 
     def __call__(self, func: Callable) -> Callable:
         """Decorator to apply rate limiting to a function."""
@@ -128,7 +274,7 @@ class RateLimiter:
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            asyncio.run(self.acquire())
+            self.acquire_sync()
             return func(*args, **kwargs)
 
         return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
@@ -148,6 +294,7 @@ class ParallelLLMProcessor:
         self.client = client
         self.rate_limiter = RateLimiter(calls_per_second=max_concurrent)
         self.processor = AsyncProcessor(max_workers=max_concurrent)
+        self.max_concurrent = max_concurrent
 
     async def generate_multiple(
         self,
@@ -155,7 +302,7 @@ class ParallelLLMProcessor:
         prompts: List[str],
         system: Optional[str] = None,
         temperature: float = 0.2,
-    ) -> List[str]:
+    ) -> SplitResults:
         """
         Generate text for multiple prompts in parallel.
 
@@ -166,17 +313,29 @@ class ParallelLLMProcessor:
             temperature: Temperature setting
 
         Returns:
-            List of generated responses
+            Tuple of (responses in prompt order, [(index, exception)])
         """
+        loop = asyncio.get_running_loop()
+        # Created per call: a semaphore binds to the loop that first awaits it
+        sem = asyncio.Semaphore(self.max_concurrent)
 
         async def generate_one(prompt: str) -> str:
-            await self.rate_limiter.acquire()
-            return self.client.generate(
-                model, prompt, system=system, temperature=temperature
-            )
+            # client.generate is a blocking HTTP call, so run it on the
+            # executor; the semaphore caps how many are in flight at once.
+            async with sem:
+                await self.rate_limiter.acquire()
+                return await loop.run_in_executor(
+                    self.processor.executor,
+                    partial(
+                        self.client.generate,
+                        model,
+                        prompt,
+                        system=system,
+                        temperature=temperature,
+                    ),
+                )
 
-        tasks = [generate_one(prompt) for prompt in prompts]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        return await gather_split([generate_one(prompt) for prompt in prompts])
 
 
 def async_timed(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
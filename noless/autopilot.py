@@ -10,6 +10,7 @@ from rich.panel import Panel
 from rich.console import Console
 
 from noless.ollama_client import OllamaClient
+from noless.json_utils import loads as json_loads
 
 console = Console()
 
@@ -47,7 +48,7 @@ class AutopilotPlanner:
         )
         response = self.client.generate(self.model_name, prompt, system=self.SYSTEM_PROMPT)
         try:
-            payload = json.loads(response)
+            payload = json_loads(response)
             return [q.strip() for q in payload.get("questions", []) if q.strip()]
         except json.JSONDecodeError:
             return []
@@ -67,7 +68,7 @@ class AutopilotPlanner:
 
         response = self.client.generate(self.model_name, prompt, system=self.SYSTEM_PROMPT)
         try:
-            payload = json.loads(response)
+            payload = json_loads(response)
         except json.JSONDecodeError:
             payload = {}
 
@@ -92,7 +93,7 @@ class AutopilotPlanner:
         )
         response = self.client.generate(self.model_name, prompt, system=self.SYSTEM_PROMPT)
         try:
-            payload = json.loads(response)
+            payload = json_loads(response)
         except json.JSONDecodeError:
             payload = {}
 
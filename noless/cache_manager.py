@@ -1,25 +1,36 @@
 """Caching system for NoLess with SQLite backend."""
 
 import sqlite3
-import json
 import hashlib
 import time
 import os
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, Tuple, Union
 from pathlib import Path
-from datetime import datetime, timedelta
+
+from noless.json_utils import dumps as json_dumps, loads as json_loads
+
+# DELETE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 
 class CacheManager:
     """SQLite-based cache manager for NoLess operations."""
 
-    def __init__(self, cache_dir: Optional[str] = None, ttl_hours: int = 24):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_hours: int = 24,
+        memory_entries: int = 1024,
+    ):
         """
         Initialize cache manager.
 
         Args:
             cache_dir: Directory for cache database (default: ~/.noless/cache)
             ttl_hours: Time-to-live for cached items in hours
+            memory_entries: Size of the in-process LRU kept in front of SQLite
         """
         if cache_dir is None:
             cache_dir = os.path.expanduser("~/.noless")
@@ -30,34 +41,98 @@ class CacheManager:
         self.db_path = self.cache_dir / "cache.db"
         self.ttl = ttl_hours * 3600  # Convert to seconds
 
-        self._init_db()
+        self._local = threading.local()
 
-    def _init_db(self) -> None:
-        """Initialize SQLite database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS cache (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    created_at REAL NOT NULL,
-                    expires_at REAL NOT NULL
-                )
-            """)
+        # key -> (expires_at, serialized value); values are kept serialized so
+        # every hit returns a fresh object, same as a read from SQLite
+        self._mem: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._mem_cap = memory_entries
+        self._mem_lock = threading.Lock()
 
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_category ON cache(category)
-            """)
+        self._init_db()
 
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_expires_at ON cache(expires_at)
-            """)
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's cached connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode; WAL + synchronous=NORMAL avoids an fsync per write
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+        return conn
+
+    def _ro_conn(self) -> sqlite3.Connection:
+        """Return this thread's read-only connection for lookups.
+
+        Under WAL, readers on a separate read-only handle never coordinate
+        with the writer, so cache hits don't queue behind writes.
+        """
+        conn = getattr(self._local, "ro_conn", None)
+        if conn is None:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA query_only=1")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.ro_conn = conn
+        return conn
+
+    def _remember(self, key: str, json_value: str, expires_at: float) -> None:
+        """Insert an entry into the in-process LRU, evicting the oldest."""
+        if self._mem_cap <= 0:
+            return
+        with self._mem_lock:
+            self._mem[key] = (expires_at, json_value)
+            self._mem.move_to_end(key)
+            if len(self._mem) > self._mem_cap:
+                self._mem.popitem(last=False)
+
+    def _recall(self, key: str) -> Optional[str]:
+        """Return the serialized value for key from the LRU if still valid."""
+        with self._mem_lock:
+            entry = self._mem.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._mem[key]
+                return None
+            self._mem.move_to_end(key)
+            return entry[1]
 
-            conn.commit()
+    def _forget_all(self) -> None:
+        """Drop every entry from the in-process LRU."""
+        with self._mem_lock:
+            self._mem.clear()
 
-    def _generate_key(self, prefix: str, data: str) -> str:
+    def _init_db(self) -> None:
+        """Initialize SQLite database schema."""
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                category TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_category ON cache(category)
+        """)
+
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_expires_at ON cache(expires_at)
+        """)
+
+    def _generate_key(self, prefix: str, data: Union[str, bytes]) -> str:
         """Generate cache key from prefix and data."""
-        hash_val = hashlib.md5(data.encode()).hexdigest()
+        if isinstance(data, str):
+            data = data.encode()
+        hash_val = hashlib.blake2b(data, digest_size=16).hexdigest()
         return f"{prefix}:{hash_val}"
 
     def set(self, key: str, value: Any, category: str = "general") -> None:
@@ -73,16 +148,55 @@ class CacheManager:
             now = time.time()
             expires_at = now + self.ttl
 
-            json_value = json.dumps(value)
+            json_value = json_dumps(value)
+
+            conn = self._conn()
+            conn.execute("""
+                INSERT OR REPLACE INTO cache (key, value, category, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (key, json_value, category, now, expires_at))
+            self._remember(key, json_value, expires_at)
+        except Exception as e:
+            print(f"[Warning] Cache write failed: {e}")
+
+    def set_many(self, items: Iterable[Tuple[str, Any, str]]) -> int:
+        """
+        Store many values in a single transaction.
+
+        Args:
+            items: Iterable of (key, value, category) tuples
+
+        Returns:
+            Number of entries written
+        """
+        try:
+            now = time.time()
+            expires_at = now + self.ttl
 
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
+            rows = [
+                (key, json_dumps(value), category, now, expires_at)
+                for key, value, category in items
+            ]
+            if not rows:
+                return 0
+
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("""
                     INSERT OR REPLACE INTO cache (key, value, category, created_at, expires_at)
                     VALUES (?, ?, ?, ?, ?)
-                """, (key, json_value, category, now, expires_at))
-                conn.commit()
+                """, rows)
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            for key, json_value, _, _, _ in rows:
+                self._remember(key, json_value, expires_at)
+            return len(rows)
         except Exception as e:
             print(f"[Warning] Cache write failed: {e}")
+            return 0
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -95,16 +209,21 @@ class CacheManager:
             Cached value or None if not found/expired
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT value FROM cache
-                    WHERE key = ? AND expires_at > ?
-                """, (key, time.time()))
-
-                row = cursor.fetchone()
-                if row:
-                    return json.loads(row[0])
-                return None
+            json_value = self._recall(key)
+            if json_value is not None:
+                return json_loads(json_value)
+
+            conn = self._ro_conn()
+            cursor = conn.execute("""
+                SELECT value, expires_at FROM cache
+                WHERE key = ? AND expires_at > ?
+            """, (key, time.time()))
+
+            row = cursor.fetchone()
+            if row:
+                self._remember(key, row[0], row[1])
+                return json_loads(row[0])
+            return None
         except Exception as e:
             print(f"[Warning] Cache read failed: {e}")
             return None
@@ -141,24 +260,40 @@ class CacheManager:
             Number of entries invalidated
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                if pattern and category:
-                    cursor = conn.execute("""
-                        DELETE FROM cache WHERE key LIKE ? AND category = ?
-                    """, (pattern, category))
-                elif pattern:
-                    cursor = conn.execute("""
-                        DELETE FROM cache WHERE key LIKE ?
-                    """, (pattern,))
-                elif category:
-                    cursor = conn.execute("""
-                        DELETE FROM cache WHERE category = ?
-                    """, (category,))
+            clauses = []
+            params = []
+            if pattern:
+                prefix = pattern[:-1]
+                if pattern.endswith("%") and "%" not in prefix and "_" not in prefix:
+                    # Plain prefix match: a key range lets SQLite seek the
+                    # primary key index instead of scanning with LIKE
+                    clauses.append("key >= ?")
+                    params.append(prefix)
+                    if prefix:
+                        clauses.append("key < ?")
+                        params.append(prefix[:-1] + chr(ord(prefix[-1]) + 1))
                 else:
-                    cursor = conn.execute("DELETE FROM cache")
-
-                conn.commit()
-                return cursor.rowcount
+                    clauses.append("key LIKE ?")
+                    params.append(pattern)
+            if category:
+                clauses.append("category = ?")
+                params.append(category)
+
+            sql = "DELETE FROM cache"
+            if clauses:
+                sql += " WHERE " + " AND ".join(clauses)
+
+            conn = self._conn()
+            if not clauses or not _HAS_RETURNING:
+                self._forget_all()
+                return conn.execute(sql, params).rowcount
+
+            # Only evict the deleted keys from the in-process LRU
+            deleted = [row[0] for row in conn.execute(sql + " RETURNING key", params)]
+            with self._mem_lock:
+                for key in deleted:
+                    self._mem.pop(key, None)
+            return len(deleted)
         except Exception as e:
             print(f"[Warning] Cache invalidation failed: {e}")
             return 0
@@ -171,12 +306,11 @@ class CacheManager:
             Number of entries removed
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    DELETE FROM cache WHERE expires_at < ?
-                """, (time.time(),))
-                conn.commit()
-                return cursor.rowcount
+            conn = self._conn()
+            cursor = conn.execute("""
+                DELETE FROM cache WHERE expires_at < ?
+            """, (time.time(),))
+            return cursor.rowcount
         except Exception as e:
             print(f"[Warning] Cache cleanup failed: {e}")
             return 0
@@ -184,28 +318,28 @@ class CacheManager:
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM cache")
-                total = cursor.fetchone()[0]
-
-                cursor = conn.execute("""
-                    SELECT COUNT(*) FROM cache WHERE expires_at < ?
-                """, (time.time(),))
-                expired = cursor.fetchone()[0]
-
-                cursor = conn.execute("""
-                    SELECT category, COUNT(*) as count FROM cache
-                    WHERE expires_at > ?
-                    GROUP BY category
-                """, (time.time(),))
-                by_category = dict(cursor.fetchall())
-
-                return {
-                    "total_entries": total,
-                    "expired_entries": expired,
-                    "valid_entries": total - expired,
-                    "by_category": by_category
-                }
+            conn = self._ro_conn()
+            cursor = conn.execute("SELECT COUNT(*) FROM cache")
+            total = cursor.fetchone()[0]
+
+            cursor = conn.execute("""
+                SELECT COUNT(*) FROM cache WHERE expires_at < ?
+            """, (time.time(),))
+            expired = cursor.fetchone()[0]
+
+            cursor = conn.execute("""
+                SELECT category, COUNT(*) as count FROM cache
+                WHERE expires_at > ?
+                GROUP BY category
+            """, (time.time(),))
+            by_category = dict(cursor.fetchall())
+
+            return {
+                "total_entries": total,
+                "expired_entries": expired,
+                "valid_entries": total - expired,
+                "by_category": by_category
+            }
         except Exception as e:
             print(f"[Warning] Cache stats failed: {e}")
             return {}
@@ -213,9 +347,9 @@ class CacheManager:
     def clear(self) -> None:
         """Clear entire cache."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM cache")
-                conn.commit()
+            self._forget_all()
+            conn = self._conn()
+            conn.execute("DELETE FROM cache")
         except Exception as e:
             print(f"[Warning] Cache clear failed: {e}")
 
@@ -2,9 +2,71 @@
 
 import ast
 import re
-from typing import Dict, List, Optional, Any
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Set, Tuple
+from noless.error_detection import parse_source
 from noless.schemas import CodeMetrics
 
+# Line classifiers: first non-blank character is code / is a comment marker
+_CODE_LINE_RE = re.compile(r"^[^\S\n]*[^\s#]", re.M)
+_COMMENT_LINE_RE = re.compile(r"^[^\S\n]*#", re.M)
+
+# Nodes that add a decision point to a function's cyclomatic complexity
+_BRANCH_NODES = (ast.If, ast.For, ast.While, ast.ExceptHandler, ast.BoolOp)
+
+
+class _DefinitionVisitor(ast.NodeVisitor):
+    """Collect functions, classes and per-function complexity in one pass.
+
+    Each function pushes its own counter, so branches inside a nested
+    function count towards that function only. Continuation lines of
+    multi-line string literals are recorded so line counting can tell a
+    ``#`` inside a string from a real comment.
+    """
+
+    def __init__(self):
+        self.functions: List[ast.AST] = []
+        self.complexities: List[int] = []
+        self.classes = 0
+        self.string_lines: Set[int] = set()
+        self._stack: List[int] = []
+
+    def _visit_function(self, node: ast.AST) -> None:
+        self.functions.append(node)
+        self._stack.append(1)
+        super().generic_visit(node)
+        self.complexities.append(self._stack.pop())
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes += 1
+        super().generic_visit(node)
+
+    def _record_string(self, node: ast.AST) -> None:
+        end = getattr(node, "end_lineno", None)
+        if end is not None and end > node.lineno:
+            self.string_lines.update(range(node.lineno + 1, end + 1))
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if isinstance(node.value, str):
+            self._record_string(node)
+
+    def visit_JoinedStr(self, node: ast.JoinedStr) -> None:
+        # Literal parts share the f-string's span; only the embedded
+        # expressions can hold further nodes of interest
+        self._record_string(node)
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                self.visit(value)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if self._stack and isinstance(node, _BRANCH_NODES):
+            self._stack[-1] += 1
+        super().generic_visit(node)
+
 
 class CodeMetricsAnalyzer:
     """Analyze code quality metrics."""
@@ -23,15 +85,7 @@ class CodeMetricsAnalyzer:
         Returns:
             CodeMetrics object with analysis results
         """
-        self.metrics = {
-            "lines_of_code": self._count_lines(code),
-            "cyclomatic_complexity": self._calculate_complexity(code),
-            "functions": self._count_functions(code),
-            "classes": self._count_classes(code),
-            "comments_ratio": self._calculate_comment_ratio(code),
-            "duplicated_lines": self._find_duplicated_lines(code),
-            "type_hints_coverage": self._calculate_type_hints_coverage(code),
-        }
+        self.metrics = dict(_compute_metrics(code))
 
         return CodeMetrics(
             lines_of_code=self.metrics["lines_of_code"],
@@ -43,114 +97,89 @@ class CodeMetricsAnalyzer:
             type_hints_coverage=self.metrics["type_hints_coverage"],
         )
 
-    def _count_lines(self, code: str) -> int:
-        """Count non-empty lines of code."""
+    @classmethod
+    def _measure(cls, code: str) -> Dict[str, Any]:
+        """Compute the raw metrics dict for code."""
         lines = code.split("\n")
-        return sum(1 for line in lines if line.strip() and not line.strip().startswith("#"))
+        tree = parse_source(code)
+
+        visitor = _DefinitionVisitor()
+        if tree is not None:
+            visitor.visit(tree)
+        functions = visitor.functions
+        code_lines, comment_lines = cls._line_stats(code, lines, visitor.string_lines)
+
+        return {
+            "lines_of_code": code_lines,
+            "cyclomatic_complexity": cls._calculate_complexity(tree, visitor.complexities),
+            "functions": len(functions),
+            "classes": visitor.classes,
+            "comments_ratio": cls._calculate_comment_ratio(code_lines, comment_lines),
+            "duplicated_lines": cls._find_duplicated_lines(lines),
+            "type_hints_coverage": cls._calculate_type_hints_coverage(tree, functions),
+        }
+
+    @staticmethod
+    def _line_stats(code: str, lines: List[str], string_lines: Set[int]) -> Tuple[int, int]:
+        """Count (code, comment) lines, treating '#' lines inside strings as code."""
+        code_lines = len(_CODE_LINE_RE.findall(code))
+        comment_lines = len(_COMMENT_LINE_RE.findall(code))
+
+        # Only continuation lines of multi-line strings need a second look
+        for lineno in string_lines:
+            if lineno <= len(lines) and lines[lineno - 1].lstrip().startswith("#"):
+                comment_lines -= 1
+                code_lines += 1
+
+        return code_lines, comment_lines
 
-    def _calculate_complexity(self, code: str) -> float:
+    @staticmethod
+    def _calculate_complexity(tree: Optional[ast.AST], complexities: List[int]) -> float:
         """Calculate average cyclomatic complexity."""
-        try:
-            tree = ast.parse(code)
-            complexities = []
-
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    complexity = 1
-                    for child in ast.walk(node):
-                        if isinstance(
-                            child,
-                            (
-                                ast.If,
-                                ast.For,
-                                ast.While,
-                                ast.ExceptHandler,
-                                ast.BoolOp,
-                            ),
-                        ):
-                            complexity += 1
-                    complexities.append(complexity)
-
-            return (
-                sum(complexities) / len(complexities) if complexities else 1.0
-            )
-        except SyntaxError:
+        if tree is None:
             return 0.0
 
-    def _count_functions(self, code: str) -> int:
-        """Count function definitions."""
-        try:
-            tree = ast.parse(code)
-            return sum(
-                1
-                for node in ast.walk(tree)
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-            )
-        except SyntaxError:
-            return 0
-
-    def _count_classes(self, code: str) -> int:
-        """Count class definitions."""
-        try:
-            tree = ast.parse(code)
-            return sum(1 for node in ast.walk(tree) if isinstance(node, ast.ClassDef))
-        except SyntaxError:
-            return 0
-
-    def _calculate_comment_ratio(self, code: str) -> float:
-        """Calculate ratio of comment lines to code lines."""
-        lines = code.split("\n")
-        comment_lines = sum(
-            1 for line in lines if line.strip().startswith("#")
+        return (
+            sum(complexities) / len(complexities) if complexities else 1.0
         )
-        code_lines = sum(1 for line in lines if line.strip())
+
+    @staticmethod
+    def _calculate_comment_ratio(code_lines: int, comment_lines: int) -> float:
+        """Calculate ratio of comment lines to non-blank lines."""
+        # Every non-blank line starts with either code or a comment marker
+        non_blank = code_lines + comment_lines
 
         return (
-            comment_lines / code_lines if code_lines > 0 else 0.0
+            comment_lines / non_blank if non_blank > 0 else 0.0
         )
 
-    def _find_duplicated_lines(self, code: str) -> int:
+    @staticmethod
+    def _find_duplicated_lines(lines: List[str]) -> int:
         """Find duplicated code segments (simple check)."""
-        lines = code.split("\n")
-        cleaned = [
-            line.strip()
-            for line in lines
-            if line.strip() and not line.strip().startswith("#")
-        ]
-
-        duplicates = 0
-        seen = set()
-        for line in cleaned:
-            if line in seen:
-                duplicates += 1
-            seen.add(line)
+        stripped = (line.strip() for line in lines)
+        counts = Counter(line for line in stripped if line and not line.startswith("#"))
 
-        return duplicates
+        # Every occurrence after the first counts as a duplicate
+        return sum(count - 1 for count in counts.values() if count > 1)
 
-    def _calculate_type_hints_coverage(self, code: str) -> float:
+    @staticmethod
+    def _calculate_type_hints_coverage(tree: Optional[ast.AST], functions: List[ast.AST]) -> float:
         """Calculate percentage of functions with type hints."""
-        try:
-            tree = ast.parse(code)
-            functions = [
-                node
-                for node in ast.walk(tree)
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-            ]
-
-            if not functions:
-                return 1.0
-
-            with_hints = sum(
-                1
-                for func in functions
-                if func.returns is not None
-                or any(arg.annotation for arg in func.args.args)
-            )
-
-            return with_hints / len(functions)
-        except SyntaxError:
+        if tree is None:
             return 0.0
 
+        if not functions:
+            return 1.0
+
+        with_hints = sum(
+            1
+            for func in functions
+            if func.returns is not None
+            or any(arg.annotation for arg in func.args.args)
+        )
+
+        return with_hints / len(functions)
+
     def get_quality_grade(self) -> str:
         """Get overall quality grade (A-F)."""
         score = self._calculate_quality_score()
@@ -205,3 +234,9 @@ class CodeMetricsAnalyzer:
             f"Score: {self._calculate_quality_score():.1f}/100",
         ]
         return "\n".join(lines)
+
+
+@lru_cache(maxsize=128)
+def _compute_metrics(code: str) -> Dict[str, Any]:
+    """Memoized metrics so re-analyzing unchanged code skips the parse."""
+    return CodeMetricsAnalyzer._measure(code)
@@ -1,24 +1,159 @@
 """AI-powered code validation and improvement using larger models."""
 
-from typing import Dict, Any, Optional
-import json
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable
+import asyncio
+import copy
+import hashlib
+import os
 import time
 import re
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
 from rich.console import Console
 from rich.panel import Panel
 from rich.live import Live
 from rich.table import Table
 from rich.syntax import Syntax
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+from rich.text import Text
+from pygments.lexers import PythonLexer
 from noless.ollama_client import OllamaClient
 from noless.local_models import LocalModelRegistry, LocalModelInfo
 from noless.schemas import CodeReviewResult, CodeIssue, CodeSuggestion, LLMResponse
 from noless.cache_manager import get_cache_manager
 from noless.code_metrics import CodeMetricsAnalyzer
 from noless.error_detection import ErrorDetector
+from noless.async_processor import AsyncProcessor, gather_split, get_process_pool
+from noless.json_utils import (
+    dumps as json_dumps,
+    loads as json_loads,
+    find_closing_bracket as _find_closing_bracket,
+    parse_llm_json as _parse_json,
+)
 
 console = Console()
 
+# Smallest context window requested for reviewer calls
+MIN_NUM_CTX = 4096
+
+# Upper bound on frames drawn by the code scan animation
+ANIMATION_MAX_FRAMES = 40
+
+# Streamed reviews are cut off past this many characters; the complete
+# issues/suggestions fields are kept and the runaway improved_code dropped.
+REVIEW_MAX_RESPONSE_CHARS = 200_000
+
+_SCAN_HIGHLIGHTER: Optional[Syntax] = None
+
+
+def _scan_highlighter() -> Syntax:
+    """Shared Syntax instance holding a ready Python lexer for the scan animation."""
+    global _SCAN_HIGHLIGHTER
+    if _SCAN_HIGHLIGHTER is None:
+        _SCAN_HIGHLIGHTER = Syntax("", PythonLexer(), theme="monokai")
+    return _SCAN_HIGHLIGHTER
+
+_RE_PY_BLOCK = re.compile(r'```python\s*(.*?)\s*```', re.DOTALL)
+_RE_ANY_BLOCK = re.compile(r'```\s*(.*?)\s*```', re.DOTALL)
+
+# Keyword alternations for mining plain-text reviews (matched on lowercased text)
+_RE_PROBLEM_MENTION = re.compile(r'error|bug|issue')
+_RE_ISSUE_WORDS = re.compile(r'error|bug|issue|problem|missing|incorrect')
+_RE_SUGGESTION_WORDS = re.compile(r'suggest|recommend|consider|should|could|better')
+
+def _review_fields_end(text: str) -> int:
+    """Index just past the suggestions array of a streamed review, or -1 if it isn't complete yet."""
+    key_idx = text.find('"suggestions"')
+    if key_idx == -1:
+        return -1
+    start_idx = text.find("[", key_idx)
+    if start_idx == -1:
+        return -1
+    end_idx = _find_closing_bracket(text, start_idx, square=True)
+    return end_idx + 1 if end_idx != -1 else -1
+
+
+@lru_cache(maxsize=256)
+def _parse_json_cached(text: str, expect_list: bool) -> Optional[str]:
+    """Memoized parse, stored serialized so every caller gets a fresh copy."""
+    parsed = _parse_json(text, expect_list)
+    return None if parsed is None else json_dumps(parsed)
+
+
+@lru_cache(maxsize=256)
+def _extract_code(response: str) -> Optional[str]:
+    """Extract Python code from LLM response (markdown or plain)."""
+    # Method 1: Extract from markdown code block
+    code_match = _RE_PY_BLOCK.search(response)
+    if code_match:
+        return code_match.group(1).strip()
+
+    # Method 2: Extract from generic code block
+    code_match = _RE_ANY_BLOCK.search(response)
+    if code_match:
+        code = code_match.group(1).strip()
+        # Check if it looks like Python
+        if 'def ' in code or 'import ' in code or 'class ' in code or code.startswith('import'):
+            return code
+
+    # Method 3: If response is mostly code (contains function/class definitions)
+    if ('def ' in response or 'class ' in response) and response.count('\n') > 2:
+        return response
+
+    return None
+
+
+def _analyze_source(
+    code: str, metrics: bool, error_detection: bool
+) -> Tuple[List[Any], Optional[Dict[str, Any]]]:
+    """Static issues and metrics for code; picklable so it can run in worker processes."""
+    static_issues: List[Any] = []
+    if error_detection:
+        analysis = ErrorDetector().analyze(code)
+        static_issues = analysis.get("security_issues", []) + analysis.get("performance_issues", [])
+
+    code_metrics = CodeMetricsAnalyzer().analyze(code).model_dump() if metrics else None
+    return static_issues, code_metrics
+
+
+REVIEW_SYSTEM_MSG = (
+    "You are a senior code reviewer. Analyze the code for bugs, best practices, and improvements."
+    " Return JSON with keys: valid (bool), issues (array of strings), suggestions (array of strings), improved_code (string)."
+    " Only include improved_code if significant changes are needed."
+)
+
+BATCH_REVIEW_SYSTEM_MSG = (
+    "You are a senior code reviewer. Analyze each file for bugs, best practices, and improvements."
+    " Return a JSON array; element i corresponds to FILE i and is an object with keys: valid (bool),"
+    " issues (array of strings), suggestions (array of strings), improved_code (string)."
+    " Only include improved_code if significant changes are needed."
+)
+
+FIX_SYSTEM_MSG = (
+    "You are an expert code fixer. Your task is to fix code issues while preserving functionality. "
+    "Return JSON with a single key fixed_code holding the complete fixed Python code. No explanations."
+)
+
+# JSON schemas passed to Ollama's ``format`` so decoding is constrained to the
+# shape we parse; no fences or prose around the JSON.
+REVIEW_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "valid": {"type": "boolean"},
+        "issues": {"type": "array", "items": {"type": "string"}},
+        "suggestions": {"type": "array", "items": {"type": "string"}},
+        "improved_code": {"type": "string"},
+    },
+    "required": ["valid", "issues", "suggestions"],
+}
+
+BATCH_REVIEW_SCHEMA: Dict[str, Any] = {"type": "array", "items": REVIEW_SCHEMA}
+
+FIX_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {"fixed_code": {"type": "string"}},
+    "required": ["fixed_code"],
+}
+
 
 class CodeValidator:
     """Validate and improve generated code using AI."""
@@ -31,18 +166,40 @@ class CodeValidator:
         enable_caching: bool = True,
         enable_metrics: bool = True,
         enable_error_detection: bool = True,
+        generate_options: Optional[Dict[str, Any]] = None,
     ):
+        """
+        Initialize code validator.
+
+        Args:
+            reviewer_model: Preferred reviewer; auto-selected if missing
+            generation_model: Model that wrote the code (avoided as reviewer)
+            ollama_client: Client to use; a default OllamaClient otherwise
+            enable_caching: Cache reviews on disk
+            enable_metrics: Attach code metrics to reviews
+            enable_error_detection: Run static security/performance checks
+            generate_options: Ollama options merged over the defaults sized
+                per prompt (num_ctx, num_batch). Concurrent reviews only run in
+                parallel if the server's OLLAMA_NUM_PARALLEL allows it.
+        """
         self.requested_reviewer_model = reviewer_model
         self.generation_model = generation_model
+        self.generate_options = dict(generate_options or {})
         self.client = ollama_client or OllamaClient()
         self.registry = LocalModelRegistry(self.client)
         self._available_models = self.registry.available_models()
+        self._available_model_names = frozenset(info.name for info in self._available_models)
         self.reviewer_model = self._resolve_reviewer_model()
 
         # Initialize optional features
         self.cache = get_cache_manager() if enable_caching else None
         self.metrics_analyzer = CodeMetricsAnalyzer() if enable_metrics else None
         self.error_detector = ErrorDetector() if enable_error_detection else None
+
+        # Drives the async review pipeline from the sync entry points
+        self._async = AsyncProcessor()
+        # Reviews currently running, by cache key
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
     
     def _resolve_reviewer_model(self) -> Optional[str]:
         """Honor user preference first, then try to auto-select a reviewer."""
@@ -56,14 +213,14 @@ class CodeValidator:
         return self._select_reviewer_model()
 
     def _has_model(self, model_name: str) -> bool:
-        return any(info.name == model_name for info in self._available_models)
+        return model_name in self._available_model_names
 
     def _select_reviewer_model(self) -> Optional[str]:
         """Choose a strong available reviewer model when the user didn't specify one."""
         if not self._available_models:
             return None
 
-        size_priority = [
+        size_priority = (
             "70b",
             "32b",
             "8x7b",
@@ -80,19 +237,20 @@ class CodeValidator:
             "3b",
             "2b",
             "1.5b",
-        ]
+        )
 
-        def matches(info: LocalModelInfo, marker: str) -> bool:
-            value = marker.lower()
-            return value in info.size.lower() or value in info.name.lower()
+        # Sort and lowercase once; the markers are already lowercase.
+        candidates = [
+            (info.name, info.size.lower(), info.name.lower())
+            for info in sorted(self._available_models, key=lambda info: info.name)
+            if not (self.generation_model and info.name == self.generation_model)
+        ]
 
         # Prefer larger reviewers that differ from the generation model if possible.
         for marker in size_priority:
-            for model_info in sorted(self._available_models, key=lambda info: info.name):
-                if self.generation_model and model_info.name == self.generation_model:
-                    continue
-                if matches(model_info, marker):
-                    return model_info.name
+            for name, size_lc, name_lc in candidates:
+                if marker in size_lc or marker in name_lc:
+                    return name
 
         # Fallback: pick any model that isn't the generation model.
         for model_info in self._available_models:
@@ -104,19 +262,159 @@ class CodeValidator:
             return self.generation_model
         return self._available_models[0].name if self._available_models else None
     
-    def validate_and_improve(self, code: str, file_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate code and suggest improvements with real-time feedback"""
+    def validate_and_improve(
+        self, code: str, file_type: str, context: Dict[str, Any], show_ui: bool = True
+    ) -> Dict[str, Any]:
+        """Validate code and suggest improvements with real-time feedback.
+
+        ``show_ui=False`` is the same as :meth:`quick_validate`.
+        """
+        return self._async.run_sync(self.validate_and_improve_async, code, file_type, context, show_ui=show_ui)
+
+    def quick_validate(self, code: str, file_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Headless review for hooks and CI: no panels, metrics, or animation.
+
+        Returns the same {valid, issues, suggestions, improved_code} dict as
+        :meth:`validate_and_improve` and shares its cache.
+        """
+        return self._async.run_sync(self.quick_validate_async, code, file_type, context)
+
+    async def quick_validate_async(self, code: str, file_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of :meth:`quick_validate`."""
+        if not self.reviewer_model:
+            return {"valid": True, "improved_code": code, "issues": [], "suggestions": []}
+
+        cache_key = self._review_cache_key(code, file_type, context)
+        if self.cache:
+            cached_result = self.cache.get(cache_key)
+            if cached_result:
+                return cached_result
+
+        return await self._share_inflight(cache_key, lambda: self._quick_review(code, file_type, context, cache_key))
+
+    async def _quick_review(self, code: str, file_type: str, context: Dict[str, Any], cache_key: str) -> Dict[str, Any]:
+        """Run the headless review and cache it."""
+        try:
+            result = await self._run_review_llm(code, file_type, context)
+        except Exception:
+            return {"valid": True, "improved_code": code, "issues": [], "suggestions": []}
+
+        if self.cache:
+            self.cache.set(cache_key, result, category="validation")
+
+        if result.get("improved_code"):
+            return result
+        return {"valid": True, "improved_code": code, "issues": result.get("issues", []), "suggestions": result.get("suggestions", [])}
+
+    async def _share_inflight(
+        self, key: str, review: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Run review() unless an identical review is already in flight, then share its result.
+
+        Concurrent callers for the same cache key (e.g. duplicate boilerplate
+        files in a project) wait for the first call instead of repeating it.
+        """
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return copy.deepcopy(await asyncio.shield(pending))
+
+        task = asyncio.ensure_future(review())
+        self._inflight[key] = task
+        try:
+            return await task
+        finally:
+            del self._inflight[key]
+
+    async def _run_review_llm(self, code: str, file_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Review code and request a fix if needed, without any display work."""
+        loop = asyncio.get_running_loop()
+        prompt = self._build_review_prompt(code, file_type, context)
+        generation = asyncio.ensure_future(
+            self._agenerate(
+                prompt,
+                system=REVIEW_SYSTEM_MSG,
+                temperature=0.2,
+                options=self._options_for(prompt),
+                format=REVIEW_SCHEMA,
+            )
+        )
+        static_issues, _ = await loop.run_in_executor(
+            self._async.executor, _analyze_source, code, False, self.error_detector is not None
+        )
+
+        result = self._parse_review_response(await generation)
+        if static_issues:
+            result["static_issues"] = static_issues
+
+        if (result.get("issues") or static_issues) and not result.get("improved_code"):
+            fixed_code = await self._request_fix(result, code, file_type, context, show_ui=False)
+            if fixed_code:
+                result["improved_code"] = fixed_code
+        return result
+
+    def validate_many(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Review several (code, file_type, context) items concurrently."""
+        return self._async.run_sync(self.validate_many_async, items)
+
+    async def validate_many_async(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Async variant of :meth:`validate_many`.
+
+        Reviews run concurrently, so the scan animation and spinners are
+        skipped (Rich only allows one live display at a time).
+        """
+        results, errors = await gather_split([
+            self.validate_and_improve_async(code, file_type, context, show_progress=False)
+            for code, file_type, context in items
+        ])
+        for index, exc in errors:
+            console.print(f"[red]⚠️  Code validation failed: {exc}[/red]\n")
+            results[index] = {"valid": True, "improved_code": items[index][0], "issues": [], "suggestions": []}
+        return results
+
+    async def validate_and_improve_async(
+        self,
+        code: str,
+        file_type: str,
+        context: Dict[str, Any],
+        show_progress: bool = True,
+        show_ui: bool = True,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`validate_and_improve`.
+
+        Args:
+            code: Source code to review
+            file_type: File name or kind shown to the reviewer
+            context: Project context (task, framework, dataset)
+            show_progress: Show the scan animation and spinners
+            show_ui: Render anything at all; False takes the quick_validate path
+        """
+        if not show_ui:
+            return await self.quick_validate_async(code, file_type, context)
+
         if not self.reviewer_model:
             return {"valid": True, "improved_code": code, "issues": [], "suggestions": []}
 
         # Check cache first
-        cache_key = f"review:{file_type}:{hash(code) & 0xffffffff}"
+        cache_key = self._review_cache_key(code, file_type, context)
         if self.cache:
             cached_result = self.cache.get(cache_key)
             if cached_result:
                 console.print("[dim]📦 Using cached review results[/dim]")
                 return cached_result
 
+        return await self._share_inflight(
+            cache_key, lambda: self._review_with_ui(code, file_type, context, cache_key, show_progress)
+        )
+
+    async def _review_with_ui(
+        self,
+        code: str,
+        file_type: str,
+        context: Dict[str, Any],
+        cache_key: str,
+        show_progress: bool,
+    ) -> Dict[str, Any]:
+        """Review code with the banner, animation and result panels."""
         # Show what's being reviewed
         console.print("\n")
         console.print(Panel.fit(
@@ -127,118 +425,388 @@ class CodeValidator:
         ))
         console.print("\n")
 
-        # Show code being reviewed with scroll animation
-        code_lines = code.split('\n')
-        total_lines = len(code_lines)
-        console.print(f"[dim]📄 Scanning {total_lines} lines...[/dim]\n")
+        # Start the request before the local work below so the animation and
+        # analysis overlap the inference wait.
+        prompt = self._build_review_prompt(code, file_type, context)
+        generation = asyncio.get_running_loop().run_in_executor(self._async.executor, self._stream_review, prompt)
+        # Static analysis and metrics don't depend on the review; run them in
+        # worker threads alongside it.
+        analysis = asyncio.ensure_future(self._analyze_locally(code))
+
+        if show_progress:
+            # Show code being reviewed with scroll animation
+            code_lines = code.split('\n')
+            total_lines = len(code_lines)
+            console.print(f"[dim]📄 Scanning {total_lines} lines...[/dim]\n")
+
+            # Show code scrolling animation (fast scan visualization) off the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                self._async.executor, self._show_code_scan_animation, code_lines, file_type
+            )
 
-        # Show code scrolling animation (fast scan visualization)
-        self._show_code_scan_animation(code_lines, file_type)
+        try:
+            if show_progress:
+                with console.status("[bold yellow]🤖 AI Reviewer analyzing code...", spinner="dots"):
+                    response = await generation
+            else:
+                response = await generation
 
-        # Run static analysis (fast, no LLM needed)
-        static_issues = []
-        if self.error_detector:
-            analysis = self.error_detector.analyze(code)
-            static_issues = analysis.get("security_issues", []) + analysis.get("performance_issues", [])
-            if static_issues:
-                console.print(f"[yellow]⚠️  Found {len(static_issues)} static analysis issues[/yellow]\n")
+            static_issues, metrics = await analysis
+            result = self._parse_review_response(response)
+            return await self._finish_review(result, code, file_type, context, cache_key, static_issues, metrics)
+        except Exception as exc:
+            console.print(f"[red]⚠️  Code validation failed: {exc}[/red]\n")
+            return {"valid": True, "improved_code": code, "issues": [], "suggestions": []}
+
+    def validate_and_improve_batch(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Review several (code, file_type, context) items with a single LLM request.
+
+        Static analysis runs in spawned worker processes, so scripts should
+        call this under an ``if __name__ == "__main__":`` guard; without one
+        it falls back to threads.
+        """
+        return self._async.run_sync(self.validate_and_improve_batch_async, items)
 
-        # Show thinking process - FAST
-        thinking_steps = [
-            "🧠 Loading model",
-            "🔍 Syntax check",
-            "⚠️  Bug detection",
-            "📋 Best practices",
-            "⚡ Performance",
-            "🔒 Security",
-            "✨ Suggestions"
+    async def validate_and_improve_batch_async(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Async variant of :meth:`validate_and_improve_batch`.
+
+        Every uncached file goes into one prompt and the reviewer answers with
+        a JSON array holding one review per file, so the instructions and the
+        model setup are paid once instead of per file. If the answer can't be
+        matched up with the files, they are reviewed individually instead.
+        """
+        if not self.reviewer_model:
+            return [
+                {"valid": True, "improved_code": code, "issues": [], "suggestions": []}
+                for code, _, _ in items
+            ]
+
+        cache_keys = [self._review_cache_key(code, file_type, context) for code, file_type, context in items]
+
+        # Identical files (same code and context) are reviewed once and the
+        # review is copied to the duplicates.
+        first_index: Dict[str, int] = {}
+        for index, key in enumerate(cache_keys):
+            first_index.setdefault(key, index)
+        unique = list(first_index.values())
+        reviews = await self._review_batch([items[index] for index in unique], [cache_keys[index] for index in unique])
+        by_key = dict(zip((cache_keys[index] for index in unique), reviews))
+
+        return [
+            by_key[key] if first_index[key] == index else copy.deepcopy(by_key[key])
+            for index, key in enumerate(cache_keys)
         ]
 
-        with Progress(
-            SpinnerColumn(spinner_name="dots"),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("[cyan]AI Analysis", total=len(thinking_steps))
+    async def _review_batch(
+        self, items: List[Tuple[str, str, Dict[str, Any]]], cache_keys: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Review distinct items, cached ones from the cache and the rest in one request."""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
 
-            for step in thinking_steps:
-                progress.update(task, description=f"[cyan]{step}")
-                time.sleep(0.1)  # FAST!
-                progress.advance(task)
+        pending = []
+        for index in range(len(items)):
+            cached_result = self.cache.get(cache_keys[index]) if self.cache else None
+            if cached_result:
+                console.print(f"[dim]📦 Using cached review results for {items[index][1]}[/dim]")
+                results[index] = cached_result
+            else:
+                pending.append(index)
 
-        console.print("[bold green]✓[/bold green] Analysis complete!\n")
+        if len(pending) <= 1:
+            for index in pending:
+                code, file_type, context = items[index]
+                results[index] = await self.validate_and_improve_async(code, file_type, context, show_progress=False)
+            return results
 
-        prompt = self._build_review_prompt(code, file_type, context)
-        system_msg = (
-            "You are a senior code reviewer. Analyze the code for bugs, best practices, and improvements."
-            " Return JSON with keys: valid (bool), issues (array of strings), suggestions (array of strings), improved_code (string)."
-            " Only include improved_code if significant changes are needed."
+        console.print("\n")
+        console.print(Panel.fit(
+            f"[bold cyan]🔍 AI Batch Code Review[/bold cyan]\n"
+            f"Reviewing: [yellow]{', '.join(items[index][1] for index in pending)}[/yellow]\n"
+            f"Model: [green]{self.reviewer_model}[/green]",
+            border_style="cyan"
+        ))
+        console.print("\n")
+
+        # Analyze every file in worker processes while the model reviews them
+        analyses = asyncio.ensure_future(asyncio.gather(
+            *(self._analyze_locally(items[index][0], use_processes=True) for index in pending)
+        ))
+
+        reviews = None
+        try:
+            prompt = self._build_review_prompt_batch([items[index] for index in pending])
+            with console.status("[bold yellow]🤖 AI Reviewer analyzing files...", spinner="dots"):
+                response = await self._agenerate(
+                    prompt,
+                    system=BATCH_REVIEW_SYSTEM_MSG,
+                    temperature=0.2,
+                    options=self._options_for(prompt),
+                    format=BATCH_REVIEW_SCHEMA,
+                )
+            reviews = self._robust_json_parse(response, expect_list=True)
+        except Exception as exc:
+            console.print(f"[yellow]⚠️  Batch review failed: {exc}[/yellow]\n")
+
+        if not (
+            isinstance(reviews, list)
+            and len(reviews) == len(pending)
+            and all(isinstance(review, dict) for review in reviews)
+        ):
+            console.print("[yellow]⚠️  Batch response didn't match the files, reviewing them individually[/yellow]\n")
+            analyses.cancel()
+            individual = await self.validate_many_async([items[index] for index in pending])
+            for index, result in zip(pending, individual):
+                results[index] = result
+            return results
+
+        try:
+            analysis_results = await analyses
+        except Exception as exc:
+            console.print(f"[yellow]⚠️  Static analysis failed: {exc}[/yellow]\n")
+            analysis_results = [([], None)] * len(pending)
+
+        finished, errors = await gather_split([
+            self._finish_review(
+                self._normalize_review(review),
+                items[index][0],
+                items[index][1],
+                items[index][2],
+                cache_keys[index],
+                static_issues,
+                metrics,
+            )
+            for index, review, (static_issues, metrics) in zip(pending, reviews, analysis_results)
+        ])
+        for position, exc in errors:
+            console.print(f"[red]⚠️  Code validation failed: {exc}[/red]\n")
+            finished[position] = {"valid": True, "improved_code": items[pending[position]][0], "issues": [], "suggestions": []}
+        for index, result in zip(pending, finished):
+            results[index] = result
+        return results
+
+    async def _agenerate(self, prompt: str, **kwargs: Any) -> str:
+        """Ask the reviewer model without blocking the event loop.
+
+        Uses the client's ``agenerate`` when it has one; otherwise its
+        blocking ``generate`` runs on the processor's executor.
+        """
+        agenerate = getattr(self.client, "agenerate", None)
+        if agenerate is not None:
+            return await agenerate(self.reviewer_model, prompt, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._async.executor, partial(self.client.generate, self.reviewer_model, prompt, **kwargs)
         )
 
+    def _options_for(self, prompt: str) -> Dict[str, Any]:
+        """Ollama options for a reviewer request carrying prompt.
+
+        num_ctx must fit the prompt plus a full rewrite of the code in the
+        reply, or Ollama silently truncates the input. It is rounded up to a
+        power of two because a different num_ctx makes Ollama reload the
+        model, and the rounding keeps successive requests on the same size.
+        """
+        needed = len(prompt) // 3 * 2 + 1024  # ~3 chars/token, reply as long as the code
+        num_ctx = max(MIN_NUM_CTX, 1 << (needed - 1).bit_length())
+        options = {"num_ctx": num_ctx, "num_batch": 512}
+        options.update(self.generate_options)
+        return options
+
+    def _review_cache_key(self, code: str, file_type: str, context: Dict[str, Any]) -> str:
+        """Cache key for a review of code.
+
+        Uses a stable blake2b digest (``hash()`` is salted per process) and
+        folds in the framework and task so reviews for different contexts
+        don't alias.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (code, context.get("framework"), context.get("task")):
+            digest.update(str(part or "").encode("utf-8"))
+            digest.update(b"\0")
+        return f"review:{file_type}:{digest.hexdigest()}"
+
+    def _stream_review(self, prompt: str) -> str:
+        """Stream the review response, reporting findings before it completes.
+
+        The schema puts issues and suggestions ahead of improved_code, so they
+        are announced as soon as they are complete. Past
+        REVIEW_MAX_RESPONSE_CHARS the stream is closed and the complete leading
+        fields are returned on their own. Clients without ``generate_stream``
+        answer in one piece through ``generate``.
+        """
+        if not hasattr(self.client, "generate_stream"):
+            return self.client.generate(
+                self.reviewer_model,
+                prompt,
+                system=REVIEW_SYSTEM_MSG,
+                temperature=0.2,
+                options=self._options_for(prompt),
+                format=REVIEW_SCHEMA,
+            )
+        stream = self.client.generate_stream(
+            self.reviewer_model,
+            prompt,
+            system=REVIEW_SYSTEM_MSG,
+            temperature=0.2,
+            options=self._options_for(prompt),
+            format=REVIEW_SCHEMA,
+        )
+        parts: List[str] = []
+        size = 0
+        fields_end = -1
+
+        try:
+            for chunk in stream:
+                parts.append(chunk)
+                size += len(chunk)
+
+                if fields_end == -1 and "]" in chunk:
+                    fields_end = _review_fields_end("".join(parts))
+                    if fields_end != -1:
+                        self._announce_review_fields("".join(parts)[:fields_end] + "}")
+
+                if size > REVIEW_MAX_RESPONSE_CHARS:
+                    console.print("[yellow]⚠️  Review response too long, keeping issues and suggestions only[/yellow]")
+                    if fields_end != -1:
+                        return "".join(parts)[:fields_end] + "}"
+                    break
+        finally:
+            stream.close()
+
+        return "".join(parts).strip()
+
+    def _announce_review_fields(self, partial_json: str) -> None:
         try:
-            with console.status("[bold yellow]🤖 AI Reviewer analyzing code...", spinner="dots"):
-                response = self.client.generate(self.reviewer_model, prompt, system=system_msg, temperature=0.2)
+            fields = json_loads(partial_json)
+        except ValueError:
+            return
+        if isinstance(fields, dict):
+            console.print(
+                f"[dim]📝 {len(fields.get('issues') or [])} issue(s), "
+                f"{len(fields.get('suggestions') or [])} suggestion(s) received, finishing review...[/dim]"
+            )
 
-            result = self._parse_review_response(response)
+    async def _analyze_locally(
+        self, code: str, use_processes: bool = False
+    ) -> Tuple[List[Any], Optional[Dict[str, Any]]]:
+        """Run static analysis and code metrics concurrently off the event loop.
+
+        Threads suit a single review. For batches, ``use_processes`` spreads
+        the CPU-bound analyzers over the shared process pool instead, where
+        they don't contend for the GIL, falling back to threads if the
+        workers can't be spawned.
+        """
+        loop = asyncio.get_running_loop()
+        if use_processes:
+            analyze = partial(
+                _analyze_source, code, self.metrics_analyzer is not None, self.error_detector is not None
+            )
+            try:
+                static_issues, metrics = await loop.run_in_executor(get_process_pool(), analyze)
+            except BrokenProcessPool:
+                # Workers can't start (e.g. the caller lacks a __main__ guard)
+                static_issues, metrics = await loop.run_in_executor(self._async.executor, analyze)
+            if static_issues:
+                console.print(f"[yellow]⚠️  Found {len(static_issues)} static analysis issues[/yellow]\n")
+            return static_issues, metrics
 
-            # Combine static analysis with LLM results
-            if result and static_issues:
-                result["static_issues"] = static_issues
+        return await asyncio.gather(
+            loop.run_in_executor(self._async.executor, self._run_static_analysis, code),
+            loop.run_in_executor(self._async.executor, self._run_metrics, code),
+        )
 
-            # Analyze code metrics
-            if self.metrics_analyzer:
-                metrics = self.metrics_analyzer.analyze(code)
-                result["metrics"] = metrics.model_dump() if hasattr(metrics, 'model_dump') else metrics.__dict__
+    def _run_metrics(self, code: str) -> Optional[Dict[str, Any]]:
+        """Compute code metrics as a plain dict."""
+        if not self.metrics_analyzer:
+            return None
 
-            # Check if we have issues but no improvements yet
-            has_issues = result and (result.get("issues") or result.get("static_issues"))
-            has_improvements = result and result.get("improved_code")
+        metrics = self.metrics_analyzer.analyze(code)
+        return metrics.model_dump() if hasattr(metrics, 'model_dump') else metrics.__dict__
 
-            # If issues found but no improved_code provided, attempt to fix them
-            if has_issues and not has_improvements:
-                result = self._attempt_to_fix_issues(result, code, file_type, context)
-                has_improvements = result and result.get("improved_code")
+    def _run_static_analysis(self, code: str) -> List[Any]:
+        """Collect security and performance issues from the static analyzers."""
+        if not self.error_detector:
+            return []
 
-            # Show review results
-            self._display_review_results(result, code, file_type)
+        analysis = self.error_detector.analyze(code)
+        static_issues = analysis.get("security_issues", []) + analysis.get("performance_issues", [])
+        if static_issues:
+            console.print(f"[yellow]⚠️  Found {len(static_issues)} static analysis issues[/yellow]\n")
+        return static_issues
 
-            # Cache the result
-            if self.cache and result:
-                self.cache.set(cache_key, result, category="validation")
+    async def _finish_review(
+        self,
+        result: Optional[Dict[str, Any]],
+        code: str,
+        file_type: str,
+        context: Dict[str, Any],
+        cache_key: str,
+        static_issues: List[Any],
+        metrics: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Merge analysis into a parsed review, fix issues, display and cache it."""
+        # Combine static analysis with LLM results
+        if result and static_issues:
+            result["static_issues"] = static_issues
+
+        # Attach code metrics
+        if result and metrics is not None:
+            result["metrics"] = metrics
+
+        # Check if we have issues but no improvements yet
+        has_issues = result and (result.get("issues") or result.get("static_issues"))
+        has_improvements = result and result.get("improved_code")
+
+        # If issues found but no improved_code provided, attempt to fix them
+        if has_issues and not has_improvements:
+            result = await self._attempt_to_fix_issues_async(result, code, file_type, context)
+            has_improvements = result and result.get("improved_code")
 
-            if result and result.get("improved_code"):
-                return result
+        # Show review results
+        self._display_review_results(result, code, file_type)
 
-            # Return proper format even if result is None
-            if result:
-                return {"valid": True, "improved_code": code, "issues": result.get("issues", []), "suggestions": result.get("suggestions", [])}
-            else:
-                return {"valid": True, "improved_code": code, "issues": [], "suggestions": []}
-        except Exception as exc:
-            console.print(f"[red]⚠️  Code validation failed: {exc}[/red]\n")
+        # Cache the result
+        if self.cache and result:
+            self.cache.set(cache_key, result, category="validation")
+
+        if result and result.get("improved_code"):
+            return result
+
+        # Return proper format even if result is None
+        if result:
+            return {"valid": True, "improved_code": code, "issues": result.get("issues", []), "suggestions": result.get("suggestions", [])}
+        else:
             return {"valid": True, "improved_code": code, "issues": [], "suggestions": []}
 
     def _show_code_scan_animation(self, code_lines: list, file_type: str):
-        """Show code scrolling animation during review - fast scroll effect"""
+        """Show code scrolling animation during review - fast scroll effect.
+
+        Skipped when output isn't a terminal or NOLESS_NO_ANIM is set. At most
+        ANIMATION_MAX_FRAMES frames are drawn, so the animation takes well under
+        a second regardless of file size.
+        """
+        if not console.is_terminal or os.environ.get("NOLESS_NO_ANIM"):
+            return
+
         total_lines = len(code_lines)
         window_size = 12
+        stride = max(3, total_lines // ANIMATION_MAX_FRAMES)
+        number_width = len(str(total_lines))
+
+        highlighter = _scan_highlighter()
 
-        with Live(console=console, refresh_per_second=60) as live:
+        # Each frame is repainted once on update instead of by a 60Hz refresh thread
+        with Live(console=console, auto_refresh=False) as live:
             # Fast scroll through all code
-            for i in range(0, total_lines, 3):  # Skip lines for speed
+            for i in range(0, total_lines, stride):
                 start = max(0, i - window_size + 1)
                 end = min(i + 1, total_lines)
 
-                visible_lines = code_lines[start:end]
-                code_text = '\n'.join(visible_lines)
-
-                syntax = Syntax(
-                    code_text,
-                    "python",
-                    theme="monokai",
-                    line_numbers=True,
-                    start_line=start + 1,
-                    word_wrap=False
+                # Only the visible window is lexed, so the work per frame is
+                # bounded by window_size rather than the file length.
+                highlighted = highlighter.highlight("\n".join(code_lines[start:end]))
+                code_text = Text("\n").join(
+                    Text.assemble((f"{number:>{number_width}} ", "dim"), line)
+                    for number, line in enumerate(highlighted.split("\n", allow_blank=True), start + 1)
                 )
 
                 scroll_info = f" ↑{start}" if start > 0 else ""
@@ -247,13 +815,13 @@ class CodeValidator:
                     scroll_info += f" ↓{remaining}"
 
                 panel = Panel(
-                    syntax,
+                    code_text,
                     title=f"[bold yellow]🔍 Scanning {file_type} [{end}/{total_lines}]{scroll_info}[/bold yellow]",
                     border_style="yellow",
                     padding=(0, 1)
                 )
 
-                live.update(panel)
+                live.update(panel, refresh=True)
                 time.sleep(0.008)  # Super fast scrolling
 
         console.print(f"[green]✓[/green] Code scan complete\n")
@@ -344,10 +912,9 @@ class CodeValidator:
             console.print("[bold green]✓[/bold green] AI generated improved version!\n")
 
             # Show diff preview (first 20 lines)
-            improved_code = result["improved_code"]
-            improved_lines = improved_code.split('\n')[:20]
-            preview = '\n'.join(improved_lines)
-            if len(result["improved_code"].split('\n')) > 20:
+            improved_lines = result["improved_code"].split('\n')
+            preview = '\n'.join(improved_lines[:20])
+            if len(improved_lines) > 20:
                 preview += "\n... (truncated)"
 
             syntax = Syntax(preview, "python", theme="monokai", line_numbers=True)
@@ -363,6 +930,14 @@ class CodeValidator:
     
     def _attempt_to_fix_issues(self, result: Dict[str, Any], original_code: str, file_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Attempt to automatically fix detected issues by requesting improved code from LLM."""
+        return self._async.run_sync(self._attempt_to_fix_issues_async, result, original_code, file_type, context)
+
+    async def _attempt_to_fix_issues_async(self, result: Dict[str, Any], original_code: str, file_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of :meth:`_attempt_to_fix_issues`.
+
+        The attempts are independent samples of the same prompt, so they are
+        requested concurrently and the first usable fix wins.
+        """
         issues = result.get("issues", [])
         static_issues = result.get("static_issues", [])
 
@@ -372,6 +947,33 @@ class CodeValidator:
         console.print("\n")
         console.print("[bold yellow]🔧 Attempting to fix detected issues...[/bold yellow]\n")
 
+        fixed_code = await self._request_fix(result, original_code, file_type, context)
+        if fixed_code:
+            result["improved_code"] = fixed_code
+            console.print("[bold green]✅ Issues fixed automatically![/bold green]\n")
+            return result
+
+        # If automatic fixing failed
+        console.print("\n[yellow]⚠️  Could not automatically fix all issues.[/yellow]")
+        console.print("[dim]Suggestions:[/dim]")
+        console.print("[dim]1. Try a larger language model (70b, 32b, or 13b)[/dim]")
+        console.print("[dim]2. Simplify the code and try again[/dim]")
+        console.print("[dim]3. Fix specific issues manually[/dim]")
+
+        return result
+
+    async def _request_fix(
+        self,
+        result: Dict[str, Any],
+        original_code: str,
+        file_type: str,
+        context: Dict[str, Any],
+        show_ui: bool = True,
+    ) -> Optional[str]:
+        """Ask the reviewer for fixed code addressing the review's issues."""
+        issues = result.get("issues", [])
+        static_issues = result.get("static_issues", [])
+
         # Format issues for the fix prompt
         issue_list = []
         for issue in issues[:3]:  # Limit to 3 main issues
@@ -402,69 +1004,55 @@ Context:
 
 Please provide the COMPLETE fixed code that addresses all issues above.
 Ensure the fixed code is syntactically correct and handles the identified problems.
-Return ONLY the fixed Python code, starting with ``` and ending with ```."""
-
-        fix_system_msg = (
-            "You are an expert code fixer. Your task is to fix code issues while preserving functionality. "
-            "Return ONLY valid Python code in a markdown code block. No explanations."
-        )
+Return the complete fixed Python code in the fixed_code field."""
 
         # Try to get fixed code
         max_attempts = 2
-        for attempt in range(1, max_attempts + 1):
-            try:
-                with console.status(f"[bold yellow]Attempt {attempt}/{max_attempts}: Generating fixes...", spinner="dots"):
-                    response = self.client.generate(
-                        self.reviewer_model,
-                        fix_prompt,
-                        system=fix_system_msg,
-                        temperature=0.3
-                    )
-
-                # Extract code from response
-                fixed_code = self._extract_code_from_response(response)
-
-                if fixed_code and fixed_code != original_code:
-                    result["improved_code"] = fixed_code
-                    console.print("[bold green]✅ Issues fixed automatically![/bold green]\n")
-                    return result
-
-            except Exception as e:
-                console.print(f"[dim]Attempt {attempt} failed: {str(e)[:50]}[/dim]")
-                if attempt < max_attempts:
-                    console.print(f"[dim]Retrying with adjusted prompt...[/dim]")
+        responses, errors = await gather_split([
+            self._agenerate(
+                fix_prompt,
+                system=FIX_SYSTEM_MSG,
+                temperature=0.3,
+                options=self._options_for(fix_prompt),
+                format=FIX_SCHEMA,
+            )
+            for _ in range(max_attempts)
+        ])
 
-        # If automatic fixing failed
-        console.print("\n[yellow]⚠️  Could not automatically fix all issues.[/yellow]")
-        console.print("[dim]Suggestions:[/dim]")
-        console.print("[dim]1. Try a larger language model (70b, 32b, or 13b)[/dim]")
-        console.print("[dim]2. Simplify the code and try again[/dim]")
-        console.print("[dim]3. Fix specific issues manually[/dim]")
+        if show_ui:
+            for attempt, exc in errors:
+                console.print(f"[dim]Attempt {attempt + 1} failed: {str(exc)[:50]}[/dim]")
 
-        return result
+        for response in responses:
+            if response is None:
+                continue
 
-    def _extract_code_from_response(self, response: str) -> Optional[str]:
-        """Extract Python code from LLM response (markdown or plain)."""
-        response = response.strip()
+            fixed_code = self._extract_fixed_code(response)
+
+            if fixed_code and fixed_code != original_code:
+                return fixed_code
 
-        # Method 1: Extract from markdown code block
-        code_match = re.search(r'```python\s*(.*?)\s*```', response, re.DOTALL)
-        if code_match:
-            return code_match.group(1).strip()
+        return None
 
-        # Method 2: Extract from generic code block
-        code_match = re.search(r'```\s*(.*?)\s*```', response, re.DOTALL)
-        if code_match:
-            code = code_match.group(1).strip()
-            # Check if it looks like Python
-            if 'def ' in code or 'import ' in code or 'class ' in code or code.startswith('import'):
-                return code
+    def _extract_fixed_code(self, response: str) -> Optional[str]:
+        """Extract fixed code from a fix response (structured, else markdown or plain)."""
+        try:
+            payload = json_loads(response)
+        except ValueError:
+            payload = None
 
-        # Method 3: If response is mostly code (contains function/class definitions)
-        if ('def ' in response or 'class ' in response) and response.count('\n') > 2:
-            return response
+        if isinstance(payload, dict) and isinstance(payload.get("fixed_code"), str):
+            fixed_code = payload["fixed_code"].strip()
+            # Models sometimes still fence the code inside the field
+            if fixed_code.startswith("```"):
+                return self._extract_code_from_response(fixed_code)
+            return fixed_code or None
 
-        return None
+        return self._extract_code_from_response(response)
+
+    def _extract_code_from_response(self, response: str) -> Optional[str]:
+        """Extract Python code from LLM response (markdown or plain)."""
+        return _extract_code(response.strip())
 
     def _build_review_prompt(self, code: str, file_type: str, context: Dict[str, Any]) -> str:
         return f"""
@@ -491,6 +1079,34 @@ Check for:
 Provide JSON response with issues, suggestions, and optionally improved_code.
 """
     
+    def _build_review_prompt_batch(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> str:
+        sections = []
+        for number, (code, file_type, context) in enumerate(items, 1):
+            sections.append(f"""### FILE {number} ({file_type}) ###
+Task: {context.get('task')} | Framework: {context.get('framework')} | Dataset: {context.get('dataset')}
+
+```python
+{code}
+```""")
+
+        return f"""
+Review the following {len(items)} files of an ML project:
+
+{chr(10).join(sections)}
+
+Check each file for:
+1. Syntax errors
+2. Import errors
+3. Logic bugs
+4. Missing error handling
+5. Performance issues
+6. Best practice violations
+7. Dataset integration correctness
+
+Respond with a JSON array of exactly {len(items)} objects; element i is the review of FILE i
+with keys valid, issues, suggestions, and optionally improved_code.
+"""
+
     def _parse_review_response(self, response: str) -> Optional[Dict[str, Any]]:
         """Parse review response - with robust fallback for non-JSON responses"""
         response = response.strip()
@@ -499,14 +1115,7 @@ Provide JSON response with issues, suggestions, and optionally improved_code.
         result = self._robust_json_parse(response)
 
         if result:
-            # Ensure required keys exist
-            if "valid" not in result:
-                result["valid"] = True
-            if "issues" not in result:
-                result["issues"] = []
-            if "suggestions" not in result:
-                result["suggestions"] = []
-            return result
+            return self._normalize_review(result)
 
         # Fallback: Try to extract useful info from plain text response
         console.print(f"[yellow]⚠️  Model returned non-JSON response, creating basic review[/yellow]")
@@ -519,15 +1128,18 @@ Provide JSON response with issues, suggestions, and optionally improved_code.
         }
 
         # Try to extract any issues mentioned
-        if "error" in response.lower() or "bug" in response.lower() or "issue" in response.lower():
-            # Extract lines that mention problems
-            for line in response.split('\n'):
+        lowered = response.lower()
+        if _RE_PROBLEM_MENTION.search(lowered):
+            # Extract lines that mention problems (lowercasing doesn't add newlines, so lines stay aligned)
+            for line, line_lower in zip(response.split('\n'), lowered.split('\n')):
                 line = line.strip()
                 if line and len(line) > 10 and len(line) < 200:
-                    if any(word in line.lower() for word in ["error", "bug", "issue", "problem", "missing", "incorrect"]):
+                    if _RE_ISSUE_WORDS.search(line_lower):
                         result["issues"].append(line[:150])
-                    elif any(word in line.lower() for word in ["suggest", "recommend", "consider", "should", "could", "better"]):
+                    elif _RE_SUGGESTION_WORDS.search(line_lower):
                         result["suggestions"].append(line[:150])
+                if len(result["issues"]) >= 5 and len(result["suggestions"]) >= 5:
+                    break
 
         # Limit to 5 items each
         result["issues"] = result["issues"][:5]
@@ -535,74 +1147,22 @@ Provide JSON response with issues, suggestions, and optionally improved_code.
 
         return result if (result["issues"] or result["suggestions"]) else {"valid": True, "issues": [], "suggestions": ["Code review completed - no specific issues found"]}
 
-    def _robust_json_parse(self, text: str) -> Optional[Dict[str, Any]]:
-        """Robustly parse JSON from LLM response, handling common small-model issues."""
-        text = text.strip()
-
-        # Method 1: Try direct JSON parse
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
+    def _normalize_review(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Ensure required keys exist on a parsed review."""
+        if "valid" not in result:
+            result["valid"] = True
+        if "issues" not in result:
+            result["issues"] = []
+        if "suggestions" not in result:
+            result["suggestions"] = []
+        return result
 
-        # Method 2: Find JSON block between ```json and ```
-        json_match = re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                pass
-
-        # Method 3: Find outermost { } pair (handles escaped strings and small models)
-        start_idx = text.find('{')
-        if start_idx != -1:
-            brace_count = 0
-            end_idx = -1
-            in_string = False
-            escape_next = False
-
-            for i in range(start_idx, len(text)):
-                char = text[i]
-
-                if escape_next:
-                    escape_next = False
-                    continue
-
-                if char == '\\':
-                    escape_next = True
-                    continue
-
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-
-                if not in_string:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            end_idx = i
-                            break
-
-            if end_idx != -1:
-                json_str = text[start_idx:end_idx + 1]
-                try:
-                    return json.loads(json_str)
-                except json.JSONDecodeError:
-                    # Try to fix common small-model issues
-                    json_str = re.sub(r',\s*([}\]])', r'\1', json_str)  # Remove trailing commas
-                    try:
-                        return json.loads(json_str)
-                    except json.JSONDecodeError:
-                        pass
-
-        # Method 4: Simple regex (last resort)
-        match = re.search(r'\{[^{}]*\}', text)
-        if match:
-            try:
-                return json.loads(match.group())
-            except json.JSONDecodeError:
-                pass
+    def _robust_json_parse(self, text: str, expect_list: bool = False) -> Optional[Any]:
+        """Robustly parse JSON from LLM response, handling common small-model issues.
 
-        return None
+        With ``expect_list`` the bracket scan looks for an outermost ``[ ]``
+        array instead of a ``{ }`` object. Results are memoized, so retries
+        that see the same response text skip the fallback scans.
+        """
+        parsed = _parse_json_cached(text.strip(), expect_list)
+        return None if parsed is None else json_loads(parsed)
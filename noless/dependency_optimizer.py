@@ -1,8 +1,8 @@
 """Lazy dependency loading and optimization."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
 import sys
-from importlib import import_module
+from importlib.util import LazyLoader, find_spec, module_from_spec
 from functools import wraps
 
 
@@ -42,7 +42,11 @@ class DependencyOptimizer:
         }
     }
 
-    _loaded_modules: Dict[str, Any] = {}
+    # Dependencies whose import already failed; probing them again is O(1)
+    _negative_cache: Set[str] = set()
+    # find_spec results: availability without executing the package
+    _spec_cache: Dict[str, bool] = {}
+    _available_frameworks: Optional[list] = None
 
     @classmethod
     def require_dependency(cls, dep_name: str) -> Any:
@@ -53,15 +57,11 @@ class DependencyOptimizer:
             dep_name: Name of dependency
 
         Returns:
-            Imported module
+            Module, executed lazily on first attribute access
 
         Raises:
             ImportError: If dependency is not available
         """
-        # Check if already loaded
-        if dep_name in cls._loaded_modules:
-            return cls._loaded_modules[dep_name]
-
         # Check if dependency exists
         if dep_name not in cls.OPTIONAL_DEPENDENCIES:
             raise ValueError(f"Unknown dependency: {dep_name}")
@@ -69,22 +69,32 @@ class DependencyOptimizer:
         dep_info = cls.OPTIONAL_DEPENDENCIES[dep_name]
         package_name = dep_info["package"]
 
-        try:
-            # Try to import
-            module = import_module(package_name)
-            cls._loaded_modules[dep_name] = module
+        # Check if already loaded (eagerly elsewhere or lazily here)
+        module = sys.modules.get(package_name)
+        if module is not None:
             return module
-        except ImportError:
-            raise ImportError(
-                f"Required dependency '{dep_name}' is not installed.\n"
-                f"Install it using: {dep_info['install_command']}\n"
-                f"This is needed for: {dep_info['required_for']}"
-            )
+
+        if dep_name not in cls._negative_cache:
+            spec = find_spec(package_name)
+            if spec is not None and spec.loader is not None:
+                loader = LazyLoader(spec.loader)
+                spec.loader = loader
+                module = module_from_spec(spec)
+                sys.modules[package_name] = module
+                loader.exec_module(module)
+                return module
+            cls._negative_cache.add(dep_name)
+
+        raise ImportError(
+            f"Required dependency '{dep_name}' is not installed.\n"
+            f"Install it using: {dep_info['install_command']}\n"
+            f"This is needed for: {dep_info['required_for']}"
+        )
 
     @classmethod
     def has_dependency(cls, dep_name: str) -> bool:
         """
-        Check if a dependency is available.
+        Check if a dependency is installed, without importing it.
 
         Args:
             dep_name: Name of dependency
@@ -92,11 +102,16 @@ class DependencyOptimizer:
         Returns:
             True if available, False otherwise
         """
-        try:
-            cls.require_dependency(dep_name)
-            return True
-        except ImportError:
+        if dep_name in cls._negative_cache:
             return False
+        if dep_name not in cls._spec_cache:
+            if dep_name not in cls.OPTIONAL_DEPENDENCIES:
+                raise ValueError(f"Unknown dependency: {dep_name}")
+            package_name = cls.OPTIONAL_DEPENDENCIES[dep_name]["package"]
+            cls._spec_cache[dep_name] = (
+                package_name in sys.modules or find_spec(package_name) is not None
+            )
+        return cls._spec_cache[dep_name]
 
     @classmethod
     def get_available_frameworks(cls) -> list:
@@ -106,11 +121,20 @@ class DependencyOptimizer:
         Returns:
             List of framework names
         """
-        available = []
-        for dep_name, dep_info in cls.OPTIONAL_DEPENDENCIES.items():
-            if dep_info["frameworks"] and cls.has_dependency(dep_name):
-                available.extend(dep_info["frameworks"])
-        return list(set(available))
+        if cls._available_frameworks is None:
+            available = []
+            for dep_name, dep_info in cls.OPTIONAL_DEPENDENCIES.items():
+                if dep_info["frameworks"] and cls.has_dependency(dep_name):
+                    available.extend(dep_info["frameworks"])
+            cls._available_frameworks = list(set(available))
+        return list(cls._available_frameworks)
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget probed dependencies, e.g. after installing one at runtime."""
+        cls._negative_cache.clear()
+        cls._spec_cache.clear()
+        cls._available_frameworks = None
 
     @classmethod
     def get_missing_dependencies(cls) -> Dict[str, Dict[str, str]]:
@@ -161,31 +185,40 @@ class DependencyOptimizer:
         print("\n" + "=" * 60)
 
 
+_FRAMEWORK_DEPENDENCIES = {
+    "pytorch": "torch",
+    "tensorflow": "tensorflow",
+    "keras": "tensorflow",
+    "sklearn": "sklearn",
+    "scikit-learn": "sklearn"
+}
+
+
 def require_framework(framework: str):
     """
     Decorator to require a specific ML framework.
 
+    The framework is probed on the first call only; once found it stays
+    available for the life of the process.
+
     Args:
         framework: Framework name (pytorch, tensorflow, sklearn)
     """
+    dep_name = _FRAMEWORK_DEPENDENCIES.get(framework, framework)
+
     def decorator(func):
+        available = False
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            framework_map = {
-                "pytorch": "torch",
-                "tensorflow": "tensorflow",
-                "keras": "tensorflow",
-                "sklearn": "sklearn",
-                "scikit-learn": "sklearn"
-            }
-
-            dep_name = framework_map.get(framework, framework)
-
-            if not DependencyOptimizer.has_dependency(dep_name):
-                raise ImportError(
-                    f"Framework '{framework}' is required but not installed.\n"
-                    f"Install using: {DependencyOptimizer.OPTIONAL_DEPENDENCIES[dep_name]['install_command']}"
-                )
+            nonlocal available
+            if not available:
+                if not DependencyOptimizer.has_dependency(dep_name):
+                    raise ImportError(
+                        f"Framework '{framework}' is required but not installed.\n"
+                        f"Install using: {DependencyOptimizer.OPTIONAL_DEPENDENCIES[dep_name]['install_command']}"
+                    )
+                available = True
 
             return func(*args, **kwargs)
         return wrapper
@@ -214,6 +247,15 @@ def optional_import(dep_name: str, fallback=None):
 class DependencyAwareConfig:
     """Configuration that adapts based on available dependencies."""
 
+    RECOMMENDATIONS = {
+        "image-classification": ("pytorch", "tensorflow"),
+        "text-classification": ("pytorch", "tensorflow"),
+        "nlp": ("pytorch", "tensorflow"),
+        "regression": ("pytorch", "tensorflow", "sklearn"),
+        "clustering": ("sklearn",),
+        "time-series": ("pytorch", "tensorflow")
+    }
+
     def __init__(self):
         """Initialize dependency-aware config."""
         self._cache = {}
@@ -254,27 +296,36 @@ class DependencyAwareConfig:
 
     def get_recommended_framework(self, task: str) -> Optional[str]:
         """Get recommended framework for a task."""
-        available = DependencyOptimizer.get_available_frameworks()
+        if "frameworks" not in self._cache:
+            self._cache["frameworks"] = frozenset(DependencyOptimizer.get_available_frameworks())
+        available = self._cache["frameworks"]
 
-        recommendations = {
-            "image-classification": ["pytorch", "tensorflow"],
-            "text-classification": ["pytorch", "tensorflow"],
-            "nlp": ["pytorch", "tensorflow"],
-            "regression": ["pytorch", "tensorflow", "sklearn"],
-            "clustering": ["sklearn"],
-            "time-series": ["pytorch", "tensorflow"]
-        }
-
-        for framework in recommendations.get(task, []):
+        for framework in self.RECOMMENDATIONS.get(task, ()):
             if framework in available:
                 return framework
 
-        return available[0] if available else None
+        return min(available) if available else None
 
     def validate_setup(self) -> Dict[str, Any]:
         """Validate NoLess installation and dependencies."""
+        available = DependencyOptimizer.get_available_frameworks()
         return {
-            "available_frameworks": DependencyOptimizer.get_available_frameworks(),
+            "available_frameworks": available,
             "missing_dependencies": DependencyOptimizer.get_missing_dependencies(),
-            "ready_to_use": len(DependencyOptimizer.get_available_frameworks()) > 0
+            "ready_to_use": len(available) > 0
         }
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily expose optional dependencies as module attributes (PEP 562).
+
+    ``dependency_optimizer.torch`` imports torch on first access only;
+    missing dependencies raise AttributeError so ``hasattr`` works.
+    """
+    if name in DependencyOptimizer.OPTIONAL_DEPENDENCIES:
+        try:
+            return DependencyOptimizer.require_dependency(name)
+        except ImportError as exc:
+            raise AttributeError(str(exc)) from exc
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,49 @@
 """Enhanced error detection including security and performance issues."""
 
 import ast
+import hashlib
 import re
-from typing import List, Dict, Optional, Any
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, List, Dict, Optional, Any, Set, Tuple
+from noless.async_processor import process_map
 from noless.schemas import SecurityIssue, PerformanceIssue
 
+# hyperscan is imported on the first scan, not when this module is imported
+_hyperscan: Any = None
+_hyperscan_probed = False
+
+# Default for the ``tree`` arguments below: parse the source on demand
+_NOT_PARSED: Any = object()
+
+
+def _get_hyperscan() -> Any:
+    """The optional hyperscan module, or None when it is not installed."""
+    global _hyperscan, _hyperscan_probed
+    if not _hyperscan_probed:
+        try:
+            import hyperscan
+        except ImportError:  # pragma: no cover - depends on environment
+            hyperscan = None
+        _hyperscan = hyperscan
+        _hyperscan_probed = True
+    return _hyperscan
+
+
+@lru_cache(maxsize=1)
+def parse_source(code: str) -> Optional[ast.AST]:
+    """Parse code once for all AST checks; None when it is not valid Python.
+
+    The last tree is kept so metrics and error detection over the same
+    source share one parse. Callers must treat the tree as read-only.
+    """
+    try:
+        return ast.parse(code)
+    except SyntaxError:
+        return None
+
 
 class SecurityAnalyzer:
     """Detect security vulnerabilities in code."""
@@ -43,74 +82,193 @@ class SecurityAnalyzer:
         },
     }
 
-    def analyze(self, code: str) -> List[SecurityIssue]:
+    FIXES = {
+        "hardcoded_secret": "Use environment variables: os.getenv('API_KEY')",
+        "eval_usage": "Use ast.literal_eval() or json.loads() for safe parsing",
+        "unvalidated_input": "Use subprocess with shell=False and validate inputs",
+        "pickle_usage": "Use json or other safe serialization formats",
+        "sql_injection": "Use parameterized queries: execute(query, params)",
+    }
+
+    # (issue_type, config, pattern) in reporting order. The patterns run over
+    # the whole source, so \s is narrowed to exclude newlines to keep every
+    # match within a single line.
+    _PATTERN_TABLE = [
+        (issue_type, config, pattern.replace(r"\s", r"[^\S\n]"))
+        for issue_type, config in SECURITY_PATTERNS.items()
+        for pattern in config["patterns"]
+    ]
+
+    # Issue fields per pattern index, so building an issue is tuple indexing
+    _TYPE_BY_ID = tuple(issue_type for issue_type, _, _ in _PATTERN_TABLE)
+    _SEVERITY_BY_ID = tuple(config["severity"] for _, config, _ in _PATTERN_TABLE)
+    _MESSAGE_BY_ID = tuple(config["message"] for _, config, _ in _PATTERN_TABLE)
+    _FIX_BY_ID = tuple(
+        map(FIXES.get, _TYPE_BY_ID, ["Review and fix this security issue"] * len(_TYPE_BY_ID))
+    )
+
+    # Without hyperscan each pattern is its own re scan rather than one fused
+    # alternation: each starts with a literal that re's prefix search skips to
+    # quickly, and an alternation loses that and measures ~2.5x slower.
+    _COMPILED_PATTERNS = [re.compile(pattern, re.IGNORECASE) for _, _, pattern in _PATTERN_TABLE]
+
+    _hyperscan_db = None
+    _hyperscan_lock = threading.Lock()
+    _hyperscan_local = threading.local()
+
+    def analyze(self, code: str, tree: Optional[ast.AST] = _NOT_PARSED) -> List[SecurityIssue]:
         """
         Analyze code for security issues.
 
         Args:
             code: Python code to analyze
+            tree: Already parsed AST of code (None if it does not parse)
 
         Returns:
             List of security issues found
         """
         issues = []
+        # Overlapping patterns of one type report a line only once
+        seen: Set[Tuple[str, int]] = set()
 
-        # Check pattern-based issues
-        for issue_type, config in self.SECURITY_PATTERNS.items():
-            for pattern in config["patterns"]:
-                for line_num, line in enumerate(code.split("\n"), 1):
-                    if re.search(pattern, line, re.IGNORECASE):
-                        issues.append(
-                            SecurityIssue(
-                                type=issue_type,
-                                severity=config["severity"],
-                                message=config["message"],
-                                line=line_num,
-                                fix=self._get_fix(issue_type),
-                            )
-                        )
+        # Check pattern-based issues, reporting each matching line once per pattern
+        if _get_hyperscan() is not None:
+            matches = self._hyperscan_matches(code)
+        else:
+            matches = self._regex_matches(code)
+
+        types = self._TYPE_BY_ID
+        for index, line_num in matches:
+            key = (types[index], line_num)
+            if key in seen:
+                continue
+            seen.add(key)
+            issues.append(
+                SecurityIssue(
+                    type=types[index],
+                    severity=self._SEVERITY_BY_ID[index],
+                    message=self._MESSAGE_BY_ID[index],
+                    line=line_num,
+                    fix=self._FIX_BY_ID[index],
+                )
+            )
 
         # AST-based analysis
-        issues.extend(self._check_ast_issues(code))
+        if tree is _NOT_PARSED:
+            tree = parse_source(code)
+        if tree is not None:
+            for issue in self._check_ast_issues(tree):
+                key = (issue.type, issue.line)
+                if key not in seen:
+                    seen.add(key)
+                    issues.append(issue)
 
         return issues
 
-    def _check_ast_issues(self, code: str) -> List[SecurityIssue]:
+    def _regex_matches(self, code: str) -> List[Tuple[int, int]]:
+        """(pattern index, line) pairs in reporting order, one re scan per pattern."""
+        matches = []
+        line_starts: Optional[List[int]] = None
+
+        for index, pattern in enumerate(self._COMPILED_PATTERNS):
+            last_line = 0
+            for match in pattern.finditer(code):
+                if line_starts is None:
+                    line_starts = [0] + [newline.end() for newline in re.finditer("\n", code)]
+                line_num = bisect_right(line_starts, match.start())
+                if line_num != last_line:
+                    matches.append((index, line_num))
+                    last_line = line_num
+
+        return matches
+
+    def _hyperscan_matches(self, code: str) -> List[Tuple[int, int]]:
+        """(pattern index, line) pairs in reporting order, all patterns in one hyperscan pass.
+
+        Hyperscan only finds candidate lines (its patterns lack \\b); each is
+        confirmed with the re pattern. Candidates are rare, so that costs next
+        to nothing.
+        """
+        try:
+            data = code.encode("utf-8")
+        except UnicodeEncodeError:
+            # Lone surrogates can't be scanned as UTF-8
+            return self._regex_matches(code)
+
+        database = self._get_hyperscan_db()
+        scratch = getattr(self._hyperscan_local, "scratch", None)
+        if scratch is None:
+            # Scratch space can't be shared between concurrent scans
+            scratch = self._hyperscan_local.scratch = _get_hyperscan().Scratch(database)
+
+        line_starts: List[int] = []
+        candidates = set()
+
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+            if not line_starts:
+                line_starts.extend([0] + [newline.end() for newline in re.finditer(b"\n", data)])
+            candidates.add((pattern_id, bisect_right(line_starts, end - 1)))
+
+        database.scan(data, match_event_handler=on_match, scratch=scratch)
+        if not candidates:
+            return []
+
+        lines = code.split("\n")
+        return [
+            (index, line_num)
+            for index, line_num in sorted(candidates)
+            if self._COMPILED_PATTERNS[index].search(lines[line_num - 1])
+        ]
+
+    @classmethod
+    def _get_hyperscan_db(cls):
+        """Compile the pattern table into a hyperscan block-mode database once."""
+        if cls._hyperscan_db is None:
+            with cls._hyperscan_lock:
+                if cls._hyperscan_db is None:
+                    hyperscan = _get_hyperscan()
+                    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                    database.compile(
+                        # \\b isn't available in UCP mode; dropping it only widens
+                        # the candidates, which re then confirms
+                        expressions=[pattern.replace(r"\b", "").encode() for _, _, pattern in cls._PATTERN_TABLE],
+                        ids=list(range(len(cls._PATTERN_TABLE))),
+                        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP]
+                        * len(cls._PATTERN_TABLE),
+                    )
+                    cls._hyperscan_db = database
+        return cls._hyperscan_db
+
+    def _check_ast_issues(self, tree: ast.AST) -> List[SecurityIssue]:
         """Check AST for security issues."""
         issues = []
-        try:
-            tree = ast.parse(code)
-
-            for node in ast.walk(tree):
-                # Check for assert statements (disabled in production)
-                if isinstance(node, ast.Assert):
-                    issues.append(
-                        SecurityIssue(
-                            type="assertion",
-                            severity="medium",
-                            message="Assertions can be disabled with -O flag, avoid for critical checks",
-                            line=node.lineno,
-                            fix="Use proper exception handling instead of assertions",
-                        )
+        for node in ast.walk(tree):
+            # Check for assert statements (disabled in production)
+            if isinstance(node, ast.Assert):
+                issues.append(
+                    SecurityIssue(
+                        type="assertion",
+                        severity="medium",
+                        message="Assertions can be disabled with -O flag, avoid for critical checks",
+                        line=node.lineno,
+                        fix="Use proper exception handling instead of assertions",
                     )
+                )
 
-                # Check for requests without timeout
-                if isinstance(node, ast.Call):
-                    func_name = self._get_call_name(node)
-                    if func_name in ("requests.get", "requests.post", "requests.request"):
-                        if not self._has_timeout_arg(node):
-                            issues.append(
-                                SecurityIssue(
-                                    type="missing_timeout",
-                                    severity="medium",
-                                    message="HTTP request without timeout could hang indefinitely",
-                                    line=node.lineno,
-                                    fix="Add timeout parameter: requests.get(url, timeout=30)",
-                                )
+            # Check for requests without timeout
+            if isinstance(node, ast.Call):
+                func_name = self._get_call_name(node)
+                if func_name in ("requests.get", "requests.post", "requests.request"):
+                    if not self._has_timeout_arg(node):
+                        issues.append(
+                            SecurityIssue(
+                                type="missing_timeout",
+                                severity="medium",
+                                message="HTTP request without timeout could hang indefinitely",
+                                line=node.lineno,
+                                fix="Add timeout parameter: requests.get(url, timeout=30)",
                             )
-
-        except SyntaxError:
-            pass
+                        )
 
         return issues
 
@@ -131,107 +289,210 @@ class SecurityAnalyzer:
 
     def _get_fix(self, issue_type: str) -> str:
         """Get suggested fix for issue type."""
-        fixes = {
-            "hardcoded_secret": "Use environment variables: os.getenv('API_KEY')",
-            "eval_usage": "Use ast.literal_eval() or json.loads() for safe parsing",
-            "unvalidated_input": "Use subprocess with shell=False and validate inputs",
-            "pickle_usage": "Use json or other safe serialization formats",
-            "sql_injection": "Use parameterized queries: execute(query, params)",
-        }
-        return fixes.get(issue_type, "Review and fix this security issue")
+        return self.FIXES.get(issue_type, "Review and fix this security issue")
+
+
+# Performance patterns; kept as separate searches like the security patterns,
+# since each one can stop at its first hit
+_RE_WILDCARD_IMPORT = re.compile(r"from\s+\*\s+import")
+_RE_DEBUG_PRINT = re.compile(r"print\s*\(\s*['\"]debug", re.IGNORECASE)
+_RE_LIST_OF_LIST = re.compile(r"list\s*\(\s*\[\s*")
+
+_LIST_MUTATORS = frozenset(("append", "insert", "remove"))
+
+
+def _is_str_expr(node: ast.AST) -> bool:
+    """True for a string literal or f-string."""
+    return isinstance(node, ast.JoinedStr) or (isinstance(node, ast.Constant) and isinstance(node.value, str))
+
+
+class _PerformanceVisitor(ast.NodeVisitor):
+    """Single-pass AST visitor behind :class:`PerformanceAnalyzer`.
+
+    Tracks whether a ``for`` loop encloses the current node, the block
+    nesting depth of each function and which names were last assigned a
+    string, so no subtree is walked more than once. Each (type, line) is
+    reported once.
+    """
+
+    def __init__(self, analyzer: "PerformanceAnalyzer"):
+        self.analyzer = analyzer
+        self.issues: List[PerformanceIssue] = []
+        self._loop_depth = 0
+        self._depth = 0
+        # (depth at function entry, deepest block depth seen) per open function
+        self._functions: List[List[int]] = []
+        self._seen: Set[Tuple[str, int]] = set()
+        self._str_names: Set[str] = set()
+
+    def _first_report(self, issue_type: str, line: int) -> bool:
+        """True the first time an issue type is reported for a line."""
+        key = (issue_type, line)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
+
+    def visit_For(self, node: ast.For) -> None:
+        self._loop_depth += 1
+        self._visit_block(node)
+        self._loop_depth -= 1
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        value = node.value
+        for target in node.targets:
+            if not isinstance(target, ast.Name):
+                continue
+            if (
+                self._loop_depth
+                and isinstance(value, ast.BinOp)
+                and isinstance(value.op, ast.Add)
+                and self._is_str_append(target.id, value.left, value.right)
+            ):
+                self._report_string_concat(node)
+            elif _is_str_expr(value):
+                self._str_names.add(target.id)
+            else:
+                self._str_names.discard(target.id)
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        if (
+            self._loop_depth
+            and isinstance(node.op, ast.Add)
+            and isinstance(node.target, ast.Name)
+            and (node.target.id in self._str_names or _is_str_expr(node.value))
+        ):
+            self._report_string_concat(node)
+        self.generic_visit(node)
+
+    def _is_str_append(self, name: str, left: ast.AST, right: ast.AST) -> bool:
+        """True for ``name + <str>`` or ``<str> + name`` rebuilding a string."""
+        for own, other in ((left, right), (right, left)):
+            if isinstance(own, ast.Name) and own.id == name:
+                return name in self._str_names or _is_str_expr(other)
+        return False
+
+    def _report_string_concat(self, node: ast.stmt) -> None:
+        if self._first_report("string_concat", node.lineno):
+            self.issues.append(self.analyzer._string_concat_issue())
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if (
+            self._loop_depth
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in _LIST_MUTATORS
+            # Nested loops enclose the same call; report its line once
+            and self._first_report("inefficient_loop", node.lineno)
+        ):
+            self.issues.append(self.analyzer._loop_mutation_issue())
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        position = len(self.issues)
+        frame = [self._depth, self._depth]
+        self._functions.append(frame)
+        self.generic_visit(node)
+        self._functions.pop()
+
+        depth = frame[1] - frame[0]
+        if self._functions:
+            outer = self._functions[-1]
+            outer[1] = max(outer[1], frame[1])
+        if depth > 4 and self._first_report("deep_nesting", node.lineno):
+            self.issues.insert(
+                position,
+                PerformanceIssue(
+                    type="deep_nesting",
+                    location=node.name,
+                    message=f"High nesting depth ({depth}) reduces readability and performance",
+                    impact="medium",
+                    suggestion="Refactor into smaller functions",
+                ),
+            )
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ListComp(self, node: ast.ListComp) -> None:
+        self.issues.extend(self.analyzer._check_comprehension(node))
+        self.generic_visit(node)
+
+    visit_DictComp = visit_ListComp
+
+    def visit_If(self, node: ast.If, elif_branch: bool = False) -> None:
+        # An ``elif`` is an If nested in ``orelse`` but sits at its parent's depth
+        if not elif_branch:
+            self._enter_block()
+        self.visit(node.test)
+        for child in node.body:
+            self.visit(child)
+        if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If):
+            self.visit_If(node.orelse[0], elif_branch=True)
+        else:
+            for child in node.orelse:
+                self.visit(child)
+        if not elif_branch:
+            self._depth -= 1
+
+    def _enter_block(self) -> None:
+        self._depth += 1
+        if self._functions and self._depth > self._functions[-1][1]:
+            self._functions[-1][1] = self._depth
+
+    def _visit_block(self, node: ast.AST) -> None:
+        self._enter_block()
+        self.generic_visit(node)
+        self._depth -= 1
+
+    visit_AsyncFor = visit_While = _visit_block
+    visit_With = visit_AsyncWith = visit_Try = _visit_block
 
 
 class PerformanceAnalyzer:
     """Detect performance anti-patterns in code."""
 
-    def analyze(self, code: str) -> List[PerformanceIssue]:
+    def analyze(self, code: str, tree: Optional[ast.AST] = _NOT_PARSED) -> List[PerformanceIssue]:
         """
         Analyze code for performance issues.
 
         Args:
             code: Python code to analyze
+            tree: Already parsed AST of code (None if it does not parse)
 
         Returns:
             List of performance issues found
         """
         issues = []
 
-        try:
-            tree = ast.parse(code)
-
-            for node in ast.walk(tree):
-                # Check for list operations in loops
-                if isinstance(node, ast.For):
-                    issues.extend(self._check_loop_patterns(node))
-
-                # Check for string concatenation in loops
-                if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
-                    issues.extend(self._check_string_concat(node))
-
-                # Check for deep nesting
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    depth = self._get_nesting_depth(node)
-                    if depth > 4:
-                        issues.append(
-                            PerformanceIssue(
-                                type="deep_nesting",
-                                location=node.name,
-                                message=f"High nesting depth ({depth}) reduces readability and performance",
-                                impact="medium",
-                                suggestion="Refactor into smaller functions",
-                            )
-                        )
-
-                # Check for list comprehension vs append
-                if isinstance(node, (ast.ListComp, ast.DictComp)):
-                    issues.extend(self._check_comprehension(node))
-
-        except SyntaxError:
-            pass
+        if tree is _NOT_PARSED:
+            tree = parse_source(code)
+        if tree is not None:
+            visitor = _PerformanceVisitor(self)
+            visitor.visit(tree)
+            issues.extend(visitor.issues)
 
         # Pattern-based checks
         issues.extend(self._check_patterns(code))
 
         return issues
 
-    def _check_loop_patterns(self, node: ast.For) -> List[PerformanceIssue]:
-        """Check for inefficient loop patterns."""
-        issues = []
-
-        # Check for list operations inside loop
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                if isinstance(child.func, ast.Attribute):
-                    if child.func.attr in ("append", "insert", "remove"):
-                        issues.append(
-                            PerformanceIssue(
-                                type="inefficient_loop",
-                                message="List modification inside loop is inefficient",
-                                impact="high",
-                                suggestion="Use list comprehension instead: [modify(x) for x in items]",
-                            )
-                        )
-
-        return issues
-
-    def _check_string_concat(self, node: ast.BinOp) -> List[PerformanceIssue]:
-        """Check for inefficient string concatenation."""
-        issues = []
-
-        if isinstance(node.left, ast.Constant) and isinstance(node.right, ast.Constant):
-            # String concatenation detected
-            parent = getattr(node, "_parent", None)
-            if isinstance(parent, ast.For):
-                issues.append(
-                    PerformanceIssue(
-                        type="string_concat",
-                        message="String concatenation in loop is slow",
-                        impact="high",
-                        suggestion="Use list + join() instead: ''.join([...])",
-                    )
-                )
+    def _loop_mutation_issue(self) -> PerformanceIssue:
+        """Issue for a list modification inside a loop."""
+        return PerformanceIssue(
+            type="inefficient_loop",
+            message="List modification inside loop is inefficient",
+            impact="high",
+            suggestion="Use list comprehension instead: [modify(x) for x in items]",
+        )
 
-        return issues
+    def _string_concat_issue(self) -> PerformanceIssue:
+        """Issue for a string rebuilt by concatenation inside a loop."""
+        return PerformanceIssue(
+            type="string_concat",
+            message="String concatenation in loop is slow",
+            impact="high",
+            suggestion="Use list + join() instead: ''.join([...])",
+        )
 
     def _check_comprehension(self, node: Any) -> List[PerformanceIssue]:
         """Verify comprehension usage is appropriate."""
@@ -243,7 +504,7 @@ class PerformanceAnalyzer:
         issues = []
 
         # Check for inefficient imports
-        if re.search(r"from\s+\*\s+import", code):
+        if _RE_WILDCARD_IMPORT.search(code):
             issues.append(
                 PerformanceIssue(
                     type="wildcard_import",
@@ -254,7 +515,7 @@ class PerformanceAnalyzer:
             )
 
         # Check for debug prints
-        if re.search(r"print\s*\(\s*['\"]debug", code, re.IGNORECASE):
+        if _RE_DEBUG_PRINT.search(code):
             issues.append(
                 PerformanceIssue(
                     type="debug_print",
@@ -265,7 +526,7 @@ class PerformanceAnalyzer:
             )
 
         # Check for list() conversion of already-iterables
-        if re.search(r"list\s*\(\s*\[\s*", code):
+        if _RE_LIST_OF_LIST.search(code):
             issues.append(
                 PerformanceIssue(
                     type="redundant_conversion",
@@ -277,24 +538,17 @@ class PerformanceAnalyzer:
 
         return issues
 
-    def _get_nesting_depth(self, node: ast.AST) -> int:
-        """Get maximum nesting depth in a function."""
-        max_depth = 0
-
-        for child in ast.walk(node):
-            depth = 0
-            current = child
-            while hasattr(current, "_parent"):
-                depth += 1
-                current = getattr(current, "_parent")
-            max_depth = max(max_depth, depth)
-
-        return max_depth
-
 
 class ErrorDetector:
     """Combined error detection with security and performance analysis."""
 
+    # blake2b(code) -> (security_issues, performance_issues), most recent last.
+    # Shared by all instances, since callers often build a fresh detector per call;
+    # bypassed when an analyzer has been swapped for another class.
+    _RESULT_CACHE_SIZE = 256
+    _results: "OrderedDict[bytes, Tuple[List[SecurityIssue], List[PerformanceIssue]]]" = OrderedDict()
+    _results_lock = threading.Lock()
+
     def __init__(self):
         """Initialize error detector."""
         self.security_analyzer = SecurityAnalyzer()
@@ -310,11 +564,62 @@ class ErrorDetector:
         Returns:
             Dictionary with security_issues and performance_issues
         """
+        if (
+            type(self.security_analyzer) is not SecurityAnalyzer
+            or type(self.performance_analyzer) is not PerformanceAnalyzer
+        ):
+            # The shared cache only holds what the stock analyzers report
+            tree = parse_source(code)
+            return {
+                "security_issues": self.security_analyzer.analyze(code, tree=tree),
+                "performance_issues": self.performance_analyzer.analyze(code, tree=tree),
+            }
+
+        key = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._results_lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+
+        if cached is None:
+            tree = parse_source(code)
+            cached = (
+                self.security_analyzer.analyze(code, tree=tree),
+                self.performance_analyzer.analyze(code, tree=tree),
+            )
+            with self._results_lock:
+                self._results[key] = cached
+                if len(self._results) > self._RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
+
+        # Fresh lists of fresh issues so callers can't alter the cached result
         return {
-            "security_issues": self.security_analyzer.analyze(code),
-            "performance_issues": self.performance_analyzer.analyze(code),
+            "security_issues": [issue.model_copy() for issue in cached[0]],
+            "performance_issues": [issue.model_copy() for issue in cached[1]],
         }
 
+    def analyze_many(self, codes: Iterable[str], chunksize: int = 8) -> List[Dict[str, Any]]:
+        """
+        Analyze several sources in parallel on the shared process pool.
+
+        The scans are CPU-bound pure Python, so threads would serialize on
+        the GIL. A single source is analyzed in-process. Worker processes
+        are spawned, so call this under an ``if __name__ == "__main__":``
+        guard; without one the workers can't start and every source is
+        analyzed in-process instead.
+
+        Args:
+            codes: Python sources to analyze
+            chunksize: Sources sent to a worker per round trip
+
+        Returns:
+            One analyze() result per source, in input order
+        """
+        codes = list(codes)
+        if len(codes) <= 1:
+            return [self.analyze(code) for code in codes]
+        return process_map(self.analyze, codes, chunksize=chunksize)
+
     def format_report(self, analysis: Dict[str, Any]) -> str:
         """Format analysis results as readable report."""
         lines = ["🔍 Error & Issue Detection Report", "=" * 40]
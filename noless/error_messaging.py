@@ -69,6 +69,25 @@ class ErrorMessageFormatter:
         }
     }
 
+    # (description, suggestion, docs) per error type, so format_error does one lookup
+    _SUGGESTION_TABLE = {
+        error_type: (info["message"], info["suggestion"], info["docs"])
+        for error_type, info in ERROR_SUGGESTIONS.items()
+    }
+    _DEFAULT_SUGGESTION = ("An error occurred", "Review the error message and traceback", "")
+
+    _SEVERITY_TABLE = {
+        **dict.fromkeys(
+            ("SyntaxError", "IndentationError", "SystemError", "MemoryError", "RecursionError"),
+            ErrorSeverity.CRITICAL.value,
+        ),
+        **dict.fromkeys(
+            ("TypeError", "ValueError", "KeyError", "IndexError", "ImportError", "ModuleNotFoundError"),
+            ErrorSeverity.ERROR.value,
+        ),
+    }
+    _DEFAULT_SEVERITY = ErrorSeverity.WARNING.value
+
     @classmethod
     def format_error(
         cls,
@@ -87,40 +106,22 @@ class ErrorMessageFormatter:
         Returns:
             Formatted error with suggestions
         """
-        context = context or {}
-
-        suggestion_info = cls.ERROR_SUGGESTIONS.get(error_type, {})
+        description, suggestion, docs = cls._SUGGESTION_TABLE.get(error_type, cls._DEFAULT_SUGGESTION)
 
-        formatted = {
+        return {
             "error_type": error_type,
             "message": error_message,
-            "severity": cls._determine_severity(error_type),
-            "description": suggestion_info.get("message", "An error occurred"),
-            "suggestion": suggestion_info.get("suggestion", "Review the error message and traceback"),
-            "documentation": suggestion_info.get("docs", ""),
-            "context": context
+            "severity": cls._SEVERITY_TABLE.get(error_type, cls._DEFAULT_SEVERITY),
+            "description": description,
+            "suggestion": suggestion,
+            "documentation": docs,
+            "context": context or {}
         }
 
-        return formatted
-
     @classmethod
     def _determine_severity(cls, error_type: str) -> str:
         """Determine error severity based on type."""
-        critical_errors = {
-            "SyntaxError", "IndentationError", "SystemError",
-            "MemoryError", "RecursionError"
-        }
-        error_errors = {
-            "TypeError", "ValueError", "KeyError", "IndexError",
-            "ImportError", "ModuleNotFoundError"
-        }
-
-        if error_type in critical_errors:
-            return ErrorSeverity.CRITICAL.value
-        elif error_type in error_errors:
-            return ErrorSeverity.ERROR.value
-        else:
-            return ErrorSeverity.WARNING.value
+        return cls._SEVERITY_TABLE.get(error_type, cls._DEFAULT_SEVERITY)
 
     @classmethod
     def format_for_display(cls, formatted_error: Dict[str, Any]) -> str:
@@ -152,6 +153,8 @@ class ErrorMessageFormatter:
 class ValidationError:
     """Enhanced validation error with actionable feedback."""
 
+    __slots__ = ("error_type", "severity", "message", "suggestion", "line_number")
+
     def __init__(
         self,
         error_type: str,
@@ -191,6 +194,13 @@ class ValidationError:
         return f"[{self.severity.value}] {self.error_type}{location}: {self.message}\nFix: {self.suggestion}"
 
 
+_STATUS_ICONS = {
+    "COMPLETED": "✓",
+    "IN_PROGRESS": "→",
+    "FAILED": "✗"
+}
+
+
 class ProgressTracker:
     """Track and report progress during code generation and validation."""
 
@@ -202,6 +212,8 @@ class ProgressTracker:
             total_steps: Total number of steps
         """
         self.total_steps = total_steps
+        # Percent per completed step; 0 for an empty plan instead of dividing by zero
+        self._scale = 100.0 / total_steps if total_steps > 0 else 0.0
         self.current_step = 0
         self.step_details: List[Dict[str, Any]] = []
 
@@ -247,7 +259,7 @@ class ProgressTracker:
 
     def get_progress_percentage(self) -> float:
         """Get current progress as percentage."""
-        return (self.current_step / self.total_steps) * 100
+        return self.current_step * self._scale
 
     def get_progress_summary(self) -> Dict[str, Any]:
         """Get progress summary."""
@@ -264,11 +276,7 @@ class ProgressTracker:
         lines.append("=" * 50)
 
         for step in self.step_details:
-            status_icon = {
-                "COMPLETED": "✓",
-                "IN_PROGRESS": "→",
-                "FAILED": "✗"
-            }.get(step["status"], "?")
+            status_icon = _STATUS_ICONS.get(step["status"], "?")
 
             lines.append(f"{status_icon} Step {step['step']}: {step['name']}")
             if step.get("description"):
@@ -1,17 +1,44 @@
 """Iterative feedback loops for continuous code refinement."""
 
-from typing import Dict, Any, List, Optional, Callable
+import copy
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import CodeType
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass
+from noless.cache_manager import get_cache_manager
 from noless.ollama_client import OllamaClient
 from rich.console import Console
 
 console = Console()
 
 
+@lru_cache(maxsize=1)
+def _get_default_client() -> OllamaClient:
+    """Client shared by loops created without one, so they share its connections."""
+    return OllamaClient()
+
+
+@lru_cache(maxsize=1)
+def _get_checker_executor() -> ThreadPoolExecutor:
+    """Pool for HybridValidation's checkers.
+
+    Kept apart from the shared worker pool: validation is itself called from
+    that pool's threads, and blocking one on work queued behind it could
+    deadlock once every worker is busy.
+    """
+    return ThreadPoolExecutor(max_workers=3, thread_name_prefix="noless-checker")
+
+
 @dataclass
 class RefinementStep:
     """Represents a refinement step in the feedback loop."""
 
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ("iteration", "code", "feedback", "improvements", "success")
+
     iteration: int
     code: str
     feedback: str
@@ -36,7 +63,7 @@ class IterativeFeedbackLoop:
             max_iterations: Maximum refinement iterations
             validator: Function to validate/test code
         """
-        self.client = client or OllamaClient()
+        self.client = client or _get_default_client()
         self.max_iterations = max_iterations
         self.validator = validator
         self.history: List[RefinementStep] = []
@@ -62,10 +89,13 @@ class IterativeFeedbackLoop:
         """
         current_code = code
         iteration = 0
+        # A failed iteration's warning goes out with the next header, one print each
+        pending_warning = ""
 
         while iteration < self.max_iterations:
             iteration += 1
-            console.print(f"\n[cyan]🔄 Refinement Iteration {iteration}/{self.max_iterations}[/cyan]")
+            console.print(f"{pending_warning}\n[cyan]🔄 Refinement Iteration {iteration}/{self.max_iterations}[/cyan]")
+            pending_warning = ""
 
             # Generate refinement
             refined_code = self._generate_refinement(
@@ -101,7 +131,10 @@ class IterativeFeedbackLoop:
 
             current_code = refined_code
             initial_feedback = feedback
-            console.print(f"[yellow]⚠️  {feedback}[/yellow]")
+            pending_warning = f"[yellow]⚠️  {feedback}[/yellow]\n"
+
+        if pending_warning:
+            console.print(pending_warning, end="")
 
         return {
             "refined_code": current_code,
@@ -150,18 +183,18 @@ Generate improved code that addresses the feedback. Return only the Python code,
     def _extract_code(self, response: str) -> str:
         """Extract Python code from response."""
         # Remove markdown code blocks if present
-        if "```python" in response:
-            start = response.find("```python") + len("```python")
-            end = response.find("```", start)
-            return response[start:end].strip()
-        elif "```" in response:
-            start = response.find("```") + len("```")
-            end = response.find("```", start)
-            return response[start:end].strip()
+        _, fence, rest = response.partition("```python")
+        if not fence:
+            _, fence, rest = response.partition("```")
+        if fence:
+            return rest.partition("```")[0].strip()
         return response.strip()
 
     def _extract_improvements(self, old_code: str, new_code: str) -> List[str]:
         """Extract what improved between versions."""
+        if old_code == new_code:
+            return ["No changes"]
+
         improvements = []
 
         if "try:" in new_code and "try:" not in old_code:
@@ -184,41 +217,77 @@ Generate improved code that addresses the feedback. Return only the Python code,
 
     def _summarize_improvements(self) -> str:
         """Summarize all improvements across iterations."""
-        all_improvements = []
+        # Dict keys dedupe in first-seen order, keeping the summary reproducible
+        improvements: Dict[str, None] = {}
         for step in self.history:
-            all_improvements.extend(step.improvements)
-        return " → ".join(set(all_improvements)) if all_improvements else "Code refined"
+            improvements.update(dict.fromkeys(step.improvements))
+        return " → ".join(improvements) if improvements else "Code refined"
+
+
+@lru_cache(maxsize=128)
+def _compile_snippet(code: str) -> CodeType:
+    """Compile code for exec, shared across validators; raises SyntaxError."""
+    return compile(code, "<string>", "exec")
 
 
 class ExecutionFeedbackValidator:
     """Validates code by attempting execution and capturing errors."""
 
-    def __init__(self, timeout: int = 5):
+    CACHE_SIZE = 256
+
+    def __init__(self, timeout: int = 5, enable_caching: bool = False):
         """
         Initialize validator.
 
         Args:
             timeout: Timeout for code execution in seconds
+            enable_caching: Also keep results in the on-disk NoLess cache,
+                so they survive across sessions
         """
         self.timeout = timeout
+        self.cache = get_cache_manager() if enable_caching else None
+        # blake2b(code) -> result; refinement often regenerates identical code
+        self._results: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
 
     def validate(self, code: str) -> Dict[str, Any]:
         """
         Validate code by execution.
 
+        Results are cached by code content, which is safe because the code
+        runs without builtins and so cannot depend on outside state.
+
         Args:
             code: Code to validate
 
         Returns:
             Validation result with success flag and feedback
         """
+        key = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        result = self._results.get(key)
+        if result is None:
+            cache_key = f"exec_validation:{key.hex()}"
+            result = self.cache.get(cache_key) if self.cache else None
+            if result is None:
+                result = self._execute(code)
+                if self.cache:
+                    self.cache.set(cache_key, result, category="validation")
+            self._results[key] = result
+            if len(self._results) > self.CACHE_SIZE:
+                self._results.popitem(last=False)
+        else:
+            self._results.move_to_end(key)
+
+        return {**result, "errors": list(result["errors"])}
+
+    def _execute(self, code: str) -> Dict[str, Any]:
+        """Execute code in a builtins-free namespace and report the outcome."""
         try:
             # Create a safe execution environment
             exec_globals = {"__builtins__": {}}
             exec_locals = {}
 
             # Try to execute the code
-            exec(code, exec_globals, exec_locals)
+            exec(_compile_snippet(code), exec_globals, exec_locals)
 
             return {
                 "success": True,
@@ -259,6 +328,9 @@ class HybridValidation:
         self.static_analyzer = static_analyzer
         self.execution_validator = execution_validator or ExecutionFeedbackValidator()
         self.lint_checker = lint_checker
+        # (blake2b(code), results) of the last validation, so validating and then
+        # asking for feedback on the same code runs the checkers once
+        self._last: Optional[Tuple[bytes, Dict[str, Any]]] = None
 
     def validate_comprehensive(self, code: str) -> Dict[str, Any]:
         """
@@ -270,6 +342,10 @@ class HybridValidation:
         Returns:
             Comprehensive validation results
         """
+        key = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        if self._last is not None and self._last[0] == key:
+            return copy.deepcopy(self._last[1])
+
         results = {
             "static_analysis": None,
             "execution": None,
@@ -279,27 +355,35 @@ class HybridValidation:
             "warnings": []
         }
 
-        # Static analysis
-        if self.static_analyzer:
-            results["static_analysis"] = self.static_analyzer(code)
-            if results["static_analysis"].get("issues"):
-                results["issues"].extend(results["static_analysis"]["issues"])
+        # Static analysis and linting are independent of execution and often
+        # shell out, so they run on the checker pool while execution runs here
+        executor = _get_checker_executor()
+        static_future = executor.submit(self.static_analyzer, code) if self.static_analyzer else None
+        lint_future = executor.submit(self.lint_checker, code) if self.lint_checker else None
 
         # Execution validation
         exec_result = self.execution_validator.validate(code)
         results["execution"] = exec_result
+
+        # Static analysis
+        if static_future:
+            results["static_analysis"] = static_future.result()
+            if results["static_analysis"].get("issues"):
+                results["issues"].extend(results["static_analysis"]["issues"])
+
         if not exec_result["success"]:
             results["issues"].append(exec_result["feedback"])
 
         # Linting
-        if self.lint_checker:
-            results["linting"] = self.lint_checker(code)
+        if lint_future:
+            results["linting"] = lint_future.result()
             if results["linting"].get("warnings"):
                 results["warnings"].extend(results["linting"]["warnings"])
 
         # Overall result
         results["overall_success"] = len(results["issues"]) == 0
 
+        self._last = (key, copy.deepcopy(results))
         return results
 
     def validate_with_feedback(self, code: str) -> str:
@@ -1,6 +1,8 @@
 """Few-shot prompting examples for improved LLM accuracy."""
 
-from typing import Dict, List, Optional
+import json
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 
 class FewShotExamples:
@@ -176,40 +178,47 @@ def validate(model, val_loader, criterion, device):
         }
     ]
 
+    # The example lists never change, so each rendering is built once per class
     @classmethod
+    @lru_cache(maxsize=None)
     def get_code_review_examples(cls) -> str:
         """Get few-shot examples for code review."""
-        examples_text = "Examples of good code reviews:\n\n"
+        parts = ["Examples of good code reviews:\n\n"]
         for i, example in enumerate(cls.CODE_REVIEW_EXAMPLES, 1):
-            examples_text += f"Example {i}:\n"
-            examples_text += f"Code:\n{example['code']}\n"
-            examples_text += f"Review format (JSON):\n"
-            examples_text += f"{{\n"
-            examples_text += f'  "valid": {str(example["review"]["valid"]).lower()},\n'
-            examples_text += f'  "issues": {example["review"]["issues"]},\n'
-            examples_text += f'  "suggestions": {example["review"]["suggestions"]}\n'
-            examples_text += f"}}\n\n"
-        return examples_text
+            review = example["review"]
+            parts.append(
+                f"Example {i}:\n"
+                f"Code:\n{example['code']}\n"
+                f"Review format (JSON):\n"
+                f"{{\n"
+                f'  "valid": {json.dumps(review["valid"])},\n'
+                f'  "issues": {json.dumps(review["issues"])},\n'
+                f'  "suggestions": {json.dumps(review["suggestions"])}\n'
+                f"}}\n\n"
+            )
+        return "".join(parts)
 
     @classmethod
+    @lru_cache(maxsize=None)
     def get_model_examples(cls) -> str:
         """Get few-shot examples for model definition."""
-        examples_text = "Examples of good model definitions:\n\n"
-        for i, example in enumerate(cls.MODEL_DEFINITION_EXAMPLES, 1):
-            examples_text += f"Example {i}: {example['description']}\n"
-            examples_text += f"Framework: {example['framework']}\n"
-            examples_text += f"Code:\n{example['example']}\n\n"
-        return examples_text
+        return cls._render_code_examples("Examples of good model definitions:\n\n", cls.MODEL_DEFINITION_EXAMPLES)
 
     @classmethod
+    @lru_cache(maxsize=None)
     def get_training_examples(cls) -> str:
         """Get few-shot examples for training scripts."""
-        examples_text = "Examples of good training loops:\n\n"
-        for i, example in enumerate(cls.TRAINING_SCRIPT_EXAMPLES, 1):
-            examples_text += f"Example {i}: {example['description']}\n"
-            examples_text += f"Framework: {example['framework']}\n"
-            examples_text += f"Code:\n{example['example']}\n\n"
-        return examples_text
+        return cls._render_code_examples("Examples of good training loops:\n\n", cls.TRAINING_SCRIPT_EXAMPLES)
+
+    @staticmethod
+    def _render_code_examples(header: str, examples: List[Dict[str, str]]) -> str:
+        """Render described code examples under a header."""
+        return header + "".join(
+            f"Example {i}: {example['description']}\n"
+            f"Framework: {example['framework']}\n"
+            f"Code:\n{example['example']}\n\n"
+            for i, example in enumerate(examples, 1)
+        )
 
 
 class ChainOfThoughtPrompting:
@@ -305,6 +314,9 @@ class PromptEnhancer:
         """
         Enhance a code review prompt.
 
+        The code-independent part comes first (see :meth:`review_prompt_prefix`),
+        so a server that caches prompt prefixes can reuse it across reviews.
+
         Args:
             code: Code to review
             file_type: Type of file (model.py, train.py, etc)
@@ -313,29 +325,19 @@ class PromptEnhancer:
         Returns:
             Enhanced prompt
         """
-        base_prompt = f"""Review this {file_type} file for a {context.get('task', 'ML')} project:
-
-```python
-{code}
-```
-
-Context:
-- Task: {context.get('task')}
-- Framework: {context.get('framework')}
-- Dataset: {context.get('dataset')}
-
-Provide JSON with: valid (bool), issues (array), suggestions (array), improved_code (string).
-"""
-
-        # Add few-shot examples
-        if self.use_few_shot:
-            base_prompt = FewShotExamples.get_code_review_examples() + base_prompt
-
-        # Add chain-of-thought
-        if self.use_cot:
-            base_prompt = ChainOfThoughtPrompting.enhance_prompt(base_prompt, "validation")
+        args = (
+            self.use_few_shot, self.use_cot, code, file_type, context.get('task', 'ML'),
+            context.get('task'), context.get('framework'), context.get('dataset'),
+        )
+        try:
+            return _render_review_prompt(*args)
+        except TypeError:
+            # Unhashable context values can't be cache keys
+            return _render_review_prompt.__wrapped__(*args)
 
-        return base_prompt
+    def review_prompt_prefix(self) -> str:
+        """The leading text shared by every review prompt from this enhancer."""
+        return _review_prompt_parts(self.use_few_shot, self.use_cot)[0]
 
     def enhance_generation_prompt(self, task: str, framework: str, dataset: str) -> str:
         """
@@ -363,3 +365,42 @@ Include:
             base_prompt = FewShotExamples.get_model_examples() + base_prompt
 
         return base_prompt
+
+
+@lru_cache(maxsize=8)
+def _review_prompt_parts(use_few_shot: bool, use_cot: bool) -> Tuple[str, str]:
+    """Static (prefix, suffix) around the code-specific part of a review prompt."""
+    prefix = FewShotExamples.get_code_review_examples() if use_few_shot else ""
+    suffix = ""
+    if use_cot:
+        marker = "\0"
+        prefix, suffix = ChainOfThoughtPrompting.enhance_prompt(prefix + marker, "validation").split(marker)
+    return prefix, suffix
+
+
+@lru_cache(maxsize=128)
+def _render_review_prompt(
+    use_few_shot: bool,
+    use_cot: bool,
+    code: str,
+    file_type: str,
+    project: str,
+    task: Optional[str],
+    framework: Optional[str],
+    dataset: Optional[str],
+) -> str:
+    """Render a review prompt; cached since the same code is often reviewed again."""
+    prefix, suffix = _review_prompt_parts(use_few_shot, use_cot)
+    return f"""{prefix}Review this {file_type} file for a {project} project:
+
+```python
+{code}
+```
+
+Context:
+- Task: {task}
+- Framework: {framework}
+- Dataset: {dataset}
+
+Provide JSON with: valid (bool), issues (array), suggestions (array), improved_code (string).
+{suffix}"""
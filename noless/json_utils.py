@@ -0,0 +1,119 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+import re
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+    HAS_ORJSON = False
+
+
+def dumps(value: Any) -> str:
+    """Serialize value to a compact JSON string."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Types orjson rejects but json accepts (e.g. int subclasses
+            # beyond 64 bits) take the stdlib path.
+            pass
+    return json.dumps(value, separators=(",", ":"))
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # NaN/Infinity literals are valid for json but not orjson
+            pass
+    return json.loads(data)
+
+
+_RE_JSON_BLOCK = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+_RE_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+_RE_SIMPLE_OBJ = re.compile(r'\{[^{}]*\}')
+
+# Tokens that matter when matching brackets: whole string literals (skipped in
+# one step, an unterminated one runs to the end), escapes outside strings, and
+# the bracket characters themselves.
+_RE_BRACE_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"?|\\.|[{}]', re.DOTALL)
+_RE_BRACKET_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"?|\\.|[\[\]]', re.DOTALL)
+
+
+def find_closing_bracket(text: str, start_idx: int, square: bool = False) -> int:
+    """Return the index closing the bracket at start_idx, or -1 if unbalanced."""
+    if square:
+        opener, closer, token_re = "[", "]", _RE_BRACKET_TOKEN
+    else:
+        opener, closer, token_re = "{", "}", _RE_BRACE_TOKEN
+    depth = 0
+    for match in token_re.finditer(text, start_idx):
+        token = match.group()
+        if token == opener:
+            depth += 1
+        elif token == closer:
+            depth -= 1
+            if depth == 0:
+                return match.start()
+    return -1
+
+
+def parse_llm_json(text: str, expect_list: bool = False) -> Optional[Any]:
+    """Parse JSON from an LLM response, trying progressively looser extraction.
+
+    Valid JSON takes the first step and never reaches the regex fallbacks.
+    With ``expect_list`` an outermost ``[ ]`` array is extracted instead of
+    a ``{ }`` object.
+    """
+    opener = "[" if expect_list else "{"
+
+    # Method 1: Try direct JSON parse
+    try:
+        return loads(text)
+    except ValueError:
+        pass
+
+    # Method 2: Find JSON block between ```json and ```
+    json_match = _RE_JSON_BLOCK.search(text)
+    if json_match:
+        try:
+            return loads(json_match.group(1))
+        except ValueError:
+            pass
+
+    # Method 3: Find outermost { } / [ ] pair (handles escaped strings and small models)
+    start_idx = text.find(opener)
+    if start_idx != -1:
+        end_idx = find_closing_bracket(text, start_idx, expect_list)
+
+        if end_idx != -1:
+            json_str = text[start_idx:end_idx + 1]
+            try:
+                return loads(json_str)
+            except ValueError:
+                # Try to fix common small-model issues
+                json_str = _RE_TRAILING_COMMA.sub(r'\1', json_str)  # Remove trailing commas
+                try:
+                    return loads(json_str)
+                except ValueError:
+                    pass
+
+    if expect_list:
+        return None
+
+    # Method 4: Simple regex (last resort)
+    match = _RE_SIMPLE_OBJ.search(text)
+    if match:
+        try:
+            return loads(match.group())
+        except ValueError:
+            pass
+
+    return None
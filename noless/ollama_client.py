@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import json
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import requests
 
+from noless.async_processor import get_default_executor
+from noless.json_utils import loads as json_loads
+
 
 class OllamaClientError(Exception):
     """Raised when an Ollama request fails."""
@@ -23,6 +28,9 @@ class OllamaClient:
     def __init__(self, host: Optional[str] = None, timeout: int = 300):
         self.base_url = (host or os.getenv("OLLAMA_HOST") or "http://localhost:11434").rstrip("/")
         self.timeout = timeout
+        # One keep-alive connection pool per client instead of a new TCP
+        # connection per request
+        self._session = requests.Session()
 
     # ------------------------------------------------------------------
     # Public API
@@ -49,29 +57,89 @@ class OllamaClient:
         system: Optional[str] = None,
         temperature: float = 0.2,
         options: Optional[Dict[str, Any]] = None,
+        format: Optional[Union[str, Dict[str, Any]]] = None,
     ) -> str:
         """Generate text with the specified model.
 
         The method requests a non-streaming response so that the CLI can parse
-        the complete payload as JSON.
+        the complete payload as JSON. ``format`` is forwarded to Ollama as-is:
+        ``"json"`` or a JSON schema constrains decoding so the response is
+        guaranteed to parse (and match the schema).
         """
-        payload: Dict[str, Any] = {
-            "model": model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {"temperature": temperature},
-        }
-
-        if system:
-            payload["system"] = system
-
-        if options:
-            payload["options"].update(options)
-
+        payload = self._generate_payload(
+            model, prompt, system=system, temperature=temperature, options=options, format=format, stream=False
+        )
         response = self._request("post", "/api/generate", json=payload)
         data = response.json()
         return data.get("response", "").strip()
 
+    def generate_stream(
+        self,
+        model: str,
+        prompt: str,
+        *,
+        system: Optional[str] = None,
+        temperature: float = 0.2,
+        options: Optional[Dict[str, Any]] = None,
+        format: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> Iterator[str]:
+        """Generate text with the specified model, yielding chunks as they arrive.
+
+        Closing the generator early closes the connection, which also stops
+        generation on the server.
+        """
+        payload = self._generate_payload(
+            model, prompt, system=system, temperature=temperature, options=options, format=format, stream=True
+        )
+
+        with self._request("post", "/api/generate", json=payload, stream=True) as response:
+            try:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = json_loads(line)
+                    if data.get("error"):
+                        raise OllamaClientError(f"Ollama request failed: {data['error']}")
+                    chunk = data.get("response")
+                    if chunk:
+                        yield chunk
+                    if data.get("done"):
+                        break
+            except requests.RequestException as exc:  # pragma: no cover - network errors
+                raise OllamaClientError(f"Ollama request failed: {exc}") from exc
+
+    async def agenerate(
+        self,
+        model: str,
+        prompt: str,
+        *,
+        system: Optional[str] = None,
+        temperature: float = 0.2,
+        options: Optional[Dict[str, Any]] = None,
+        format: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> str:
+        """Async variant of :meth:`generate`.
+
+        The blocking HTTP request runs on the shared worker pool,
+        so several generations can be awaited together with ``asyncio.gather``.
+        The server only serves them in parallel if ``OLLAMA_NUM_PARALLEL``
+        allows it (and ``OLLAMA_MAX_LOADED_MODELS`` when the requests target
+        different models); otherwise they queue server-side.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_default_executor(),
+            partial(
+                self.generate,
+                model,
+                prompt,
+                system=system,
+                temperature=temperature,
+                options=options,
+                format=format,
+            ),
+        )
+
     def chat(self, model: str, messages: List[Dict[str, str]], *, options: Optional[Dict[str, Any]] = None) -> str:
         """Minimal chat endpoint wrapper."""
         payload: Dict[str, Any] = {
@@ -89,10 +157,39 @@ class OllamaClient:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _generate_payload(
+        self,
+        model: str,
+        prompt: str,
+        *,
+        system: Optional[str],
+        temperature: float,
+        options: Optional[Dict[str, Any]],
+        format: Optional[Union[str, Dict[str, Any]]],
+        stream: bool,
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "model": model,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {"temperature": temperature},
+        }
+
+        if system:
+            payload["system"] = system
+
+        if options:
+            payload["options"].update(options)
+
+        if format:
+            payload["format"] = format
+
+        return payload
+
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.request(method, url, timeout=self.timeout, **kwargs)
+            response = self._session.request(method, url, timeout=self.timeout, **kwargs)
             response.raise_for_status()
             return response
         except requests.RequestException as exc:  # pragma: no cover - network errors
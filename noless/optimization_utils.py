@@ -1,10 +1,20 @@
 """Utility functions for accessing and managing optimizations."""
 
-from typing import Optional, Dict, Any
+import hashlib
+import threading
+from functools import partial
+from typing import Optional, Dict, Any, Iterable, List
+from pydantic import TypeAdapter
 from noless.cache_manager import get_cache_manager, CacheManager
-from noless.async_processor import AsyncProcessor, RateLimiter, ParallelLLMProcessor
+from noless.async_processor import AsyncProcessor, RateLimiter, ParallelLLMProcessor, process_map
 from noless.code_metrics import CodeMetricsAnalyzer
 from noless.error_detection import ErrorDetector, SecurityAnalyzer, PerformanceAnalyzer
+from noless.schemas import SecurityIssue, PerformanceIssue
+
+# Dump a whole issue list in one pydantic-core call instead of a
+# per-issue .dict() round trip through Python.
+_SECURITY_ISSUES = TypeAdapter(List[SecurityIssue])
+_PERFORMANCE_ISSUES = TypeAdapter(List[PerformanceIssue])
 
 
 class OptimizationToolkit:
@@ -36,16 +46,60 @@ class OptimizationToolkit:
         Returns:
             Dictionary with all analysis results
         """
-        results = {}
+        if not self.cache:
+            return _analyze_code(code, self.metrics_analyzer, self.error_detector)
+
+        return self.cache.get_or_compute(
+            self._analysis_key(code),
+            lambda: _analyze_code(code, self.metrics_analyzer, self.error_detector),
+            category="analysis",
+        )
+
+    def _analysis_key(self, code: str) -> str:
+        """Cache key for analyze_code() results on code."""
+        # Keyed on the exact source: reformatting shifts the line numbers the
+        # issues point at, so only byte-identical re-runs may share a result.
+        # The enabled analyzers are part of the key since they shape the result.
+        digest = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+        enabled = f"{self.metrics_analyzer is not None:d}{self.error_detector is not None:d}"
+        return f"code_analysis:{enabled}:{digest}"
+
+    def analyze_many(self, codes: Iterable[str], chunksize: int = 4) -> List[Dict[str, Any]]:
+        """
+        Analyze several sources in parallel on the shared process pool.
 
-        if self.metrics_analyzer:
-            results["metrics"] = self.metrics_analyzer.analyze(code).model_dump()
+        Cached sources are answered from the cache and only the misses go to
+        the pool, largest first so one big file doesn't start last and hold
+        up the whole batch. Worker processes are spawned, so call this under
+        an ``if __name__ == "__main__":`` guard; without one the misses are
+        analyzed in-process instead.
 
-        if self.error_detector:
-            analysis = self.error_detector.analyze(code)
-            results["security_issues"] = [issue.dict() for issue in analysis.get("security_issues", [])]
-            results["performance_issues"] = [issue.dict() for issue in analysis.get("performance_issues", [])]
+        Args:
+            codes: Code to analyze
+            chunksize: Sources sent to a worker per round trip
 
+        Returns:
+            One analyze_code() result per source, in input order
+        """
+        codes = list(codes)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(codes)
+        if self.cache:
+            keys = [self._analysis_key(code) for code in codes]
+            results = [self.cache.get(key) for key in keys]
+        misses = [index for index, result in enumerate(results) if result is None]
+
+        analyze = partial(_analyze_code, metrics_analyzer=self.metrics_analyzer, error_detector=self.error_detector)
+        if len(misses) <= 1:
+            for index in misses:
+                results[index] = analyze(codes[index])
+        else:
+            misses.sort(key=lambda index: len(codes[index]), reverse=True)
+            computed = process_map(analyze, [codes[index] for index in misses], chunksize=chunksize)
+            for index, result in zip(misses, computed):
+                results[index] = result
+
+        if self.cache and misses:
+            self.cache.set_many((keys[index], results[index], "analysis") for index in misses)
         return results
 
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -129,15 +183,37 @@ class OptimizationToolkit:
             self.async_processor.shutdown()
 
 
+def _analyze_code(
+    code: str,
+    metrics_analyzer: Optional[CodeMetricsAnalyzer],
+    error_detector: Optional[ErrorDetector],
+) -> Dict[str, Any]:
+    """Metrics and error analysis of one source; module-level so workers can run it."""
+    results = {}
+
+    if metrics_analyzer:
+        results["metrics"] = metrics_analyzer.analyze(code).model_dump()
+
+    if error_detector:
+        analysis = error_detector.analyze(code)
+        results["security_issues"] = _SECURITY_ISSUES.dump_python(analysis.get("security_issues", []))
+        results["performance_issues"] = _PERFORMANCE_ISSUES.dump_python(analysis.get("performance_issues", []))
+
+    return results
+
+
 # Global toolkit instance
 _toolkit: Optional[OptimizationToolkit] = None
+_toolkit_lock = threading.Lock()
 
 
 def get_toolkit() -> OptimizationToolkit:
     """Get or create global optimization toolkit."""
     global _toolkit
     if _toolkit is None:
-        _toolkit = OptimizationToolkit()
+        with _toolkit_lock:
+            if _toolkit is None:
+                _toolkit = OptimizationToolkit()
     return _toolkit
 
 
@@ -151,7 +227,23 @@ def enable_optimizations(enable_caching: bool = True, enable_metrics: bool = Tru
         enable_error_detection: Enable error/security detection
     """
     global _toolkit
-    _toolkit = OptimizationToolkit(enable_all=True)
+    with _toolkit_lock:
+        # Reconfigure the existing toolkit in place; building a new one per
+        # call would strand the old processor's background loop thread.
+        if _toolkit is None:
+            _toolkit = OptimizationToolkit(enable_all=True)
+        toolkit = _toolkit
+        toolkit.cache = get_cache_manager() if enable_caching else None
+        toolkit.metrics_analyzer = (toolkit.metrics_analyzer or CodeMetricsAnalyzer()) if enable_metrics else None
+        if enable_error_detection:
+            toolkit.error_detector = toolkit.error_detector or ErrorDetector()
+            toolkit.security_analyzer = toolkit.security_analyzer or SecurityAnalyzer()
+            toolkit.performance_analyzer = toolkit.performance_analyzer or PerformanceAnalyzer()
+        else:
+            toolkit.error_detector = toolkit.security_analyzer = toolkit.performance_analyzer = None
+        if toolkit.async_processor is None:
+            toolkit.async_processor = AsyncProcessor(max_workers=4)
+        toolkit.enabled = True
 
 
 def clear_all_caches() -> None:
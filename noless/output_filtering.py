@@ -50,10 +50,11 @@ class OutputFilter:
             # Include code preview but mark as preview
             filtered = result.copy()
             if filtered.get("improved_code"):
-                # Only include first 10 lines as preview
-                lines = filtered["improved_code"].split('\n')[:10]
-                filtered["improved_code_preview"] = '\n'.join(lines)
-                if len(filtered["improved_code"].split('\n')) > 10:
+                # Only include first 10 lines as preview; a bounded split stops
+                # scanning after the preview instead of splitting every line
+                lines = filtered["improved_code"].split('\n', 10)
+                filtered["improved_code_preview"] = '\n'.join(lines[:10])
+                if len(lines) > 10:
                     filtered["improved_code_preview"] += "\n... (truncated - use FULL mode to see all)"
                 del filtered["improved_code"]
             return filtered
@@ -65,7 +66,8 @@ class OutputFilter:
                 "issue_count": len(result.get("issues", [])),
                 "suggestion_count": len(result.get("suggestions", [])),
                 "has_improvements": bool(result.get("improved_code")),
-                "quality_grade": self._extract_grade(result)
+                # metrics may be missing or None (ANALYSIS_ONLY emits None)
+                "quality_grade": (result.get("metrics") or {}).get("grade", "unknown")
             }
 
         else:  # FULL mode
@@ -100,11 +102,11 @@ class OutputFilter:
             # Add previews of each file
             for file_path, content in result.get("file_contents", {}).items():
                 if isinstance(content, str):
-                    lines = content.split('\n')[:15]
+                    lines = content.split('\n', 15)
                     preview["file_previews"][file_path] = {
-                        "preview": '\n'.join(lines),
-                        "total_lines": len(content.split('\n')),
-                        "truncated": len(content.split('\n')) > 15
+                        "preview": '\n'.join(lines[:15]),
+                        "total_lines": content.count('\n') + 1,
+                        "truncated": len(lines) > 15
                     }
 
             return preview
@@ -122,17 +124,50 @@ class OutputFilter:
         else:  # FULL mode
             return result
 
-    @staticmethod
-    def _extract_grade(result: Dict[str, Any]) -> Optional[str]:
-        """Extract quality grade from metrics."""
-        metrics = result.get("metrics", {})
-        # This would ideally come from code_metrics module
-        return metrics.get("grade", "unknown")
-
 
 class DryRunGenerator:
     """Generate dry-run previews without actual file creation."""
 
+    # Built once; previously rebuilt on every preview_model_code call
+    _MODEL_PREVIEWS = {
+        ("image-classification", "pytorch"): """
+class ImageClassifier(nn.Module):
+    def __init__(self, num_classes: int = 10):
+        super().__init__()
+        self.features = nn.Sequential(...)
+        self.classifier = nn.Sequential(...)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        ...
+""",
+        ("text-classification", "pytorch"): """
+class TextClassifier(nn.Module):
+    def __init__(self, vocab_size: int, num_classes: int):
+        super().__init__()
+        self.embedding = nn.Embedding(vocab_size, 128)
+        self.lstm = nn.LSTM(128, 256, batch_first=True)
+        self.classifier = nn.Linear(256, num_classes)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        ...
+""",
+        ("regression", "pytorch"): """
+class RegressionModel(nn.Module):
+    def __init__(self, input_size: int):
+        super().__init__()
+        self.layers = nn.Sequential(
+            nn.Linear(input_size, 128),
+            nn.ReLU(),
+            nn.Linear(128, 64),
+            nn.ReLU(),
+            nn.Linear(64, 1)
+        )
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        ...
+"""
+    }
+
     @staticmethod
     def preview_project_generation(
         task: str,
@@ -192,48 +227,10 @@ class DryRunGenerator:
         Returns:
             Code preview
         """
-        previews = {
-            ("image-classification", "pytorch"): """
-class ImageClassifier(nn.Module):
-    def __init__(self, num_classes: int = 10):
-        super().__init__()
-        self.features = nn.Sequential(...)
-        self.classifier = nn.Sequential(...)
-
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
-        ...
-""",
-            ("text-classification", "pytorch"): """
-class TextClassifier(nn.Module):
-    def __init__(self, vocab_size: int, num_classes: int):
-        super().__init__()
-        self.embedding = nn.Embedding(vocab_size, 128)
-        self.lstm = nn.LSTM(128, 256, batch_first=True)
-        self.classifier = nn.Linear(256, num_classes)
-
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
-        ...
-""",
-            ("regression", "pytorch"): """
-class RegressionModel(nn.Module):
-    def __init__(self, input_size: int):
-        super().__init__()
-        self.layers = nn.Sequential(
-            nn.Linear(input_size, 128),
-            nn.ReLU(),
-            nn.Linear(128, 64),
-            nn.ReLU(),
-            nn.Linear(64, 1)
+        code_preview = DryRunGenerator._MODEL_PREVIEWS.get(
+            (task, framework), "# Custom model template will be generated"
         )
 
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
-        ...
-"""
-        }
-
-        key = (task, framework)
-        code_preview = previews.get(key, "# Custom model template will be generated")
-
         return {
             "dry_run": True,
             "model_preview": code_preview,
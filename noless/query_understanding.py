@@ -1,10 +1,10 @@
 """Smart query understanding using small LLMs for better dataset search."""
 
-import json
 import re
 from typing import Dict, Any, List, Optional
 from rich.console import Console
 from noless.ollama_client import OllamaClient
+from noless.json_utils import parse_llm_json
 from noless.local_models import LocalModelRegistry
 
 console = Console()
@@ -12,75 +12,7 @@ console = Console()
 
 def _robust_json_parse(text: str) -> Optional[Dict[str, Any]]:
     """Robustly parse JSON from LLM response, handling common issues."""
-    text = text.strip()
-
-    # Method 1: Try to parse the entire response
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
-
-    # Method 2: Find JSON block between ```json and ```
-    json_block_match = re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL)
-    if json_block_match:
-        try:
-            return json.loads(json_block_match.group(1))
-        except json.JSONDecodeError:
-            pass
-
-    # Method 3: Find the outermost { } pair with proper brace matching
-    start_idx = text.find('{')
-    if start_idx != -1:
-        brace_count = 0
-        end_idx = -1
-        in_string = False
-        escape_next = False
-
-        for i in range(start_idx, len(text)):
-            char = text[i]
-
-            if escape_next:
-                escape_next = False
-                continue
-
-            if char == '\\':
-                escape_next = True
-                continue
-
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-
-            if not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end_idx = i
-                        break
-
-        if end_idx != -1:
-            json_str = text[start_idx:end_idx + 1]
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                # Try to fix common issues
-                json_str = re.sub(r',\s*([}\]])', r'\1', json_str)
-                try:
-                    return json.loads(json_str)
-                except json.JSONDecodeError:
-                    pass
-
-    # Method 4: Try to find just the first simple object
-    match = re.search(r'\{[^{}]*\}', text)
-    if match:
-        try:
-            return json.loads(match.group())
-        except json.JSONDecodeError:
-            pass
-
-    return None
+    return parse_llm_json(text.strip())
 
 
 class QueryUnderstanding:
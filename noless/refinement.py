@@ -11,84 +11,23 @@ from rich.prompt import Prompt, Confirm
 from rich.table import Table
 from rich.syntax import Syntax
 from noless.ollama_client import OllamaClient
+from noless.json_utils import loads as json_loads, parse_llm_json
 
 console = Console()
 
+# Keyword classification for refinement requests; earlier categories win
+_REQUEST_KEYWORDS = (
+    ("explain", ("explain", "what", "how", "why", "describe", "tell me", "show me")),
+    ("add", ("add", "create", "new", "implement", "build", "write")),
+    ("fix", ("fix", "bug", "broken", "error", "issue", "problem")),
+    ("optimize", ("optimize", "faster", "efficient", "speed", "performance", "improve", "better")),
+    ("refactor", ("refactor", "restructure", "organize", "clean", "rewrite", "redesign")),
+)
+
 
 def _robust_json_parse(text: str) -> Optional[Dict[str, Any]]:
     """Robustly parse JSON from LLM response, handling common issues."""
-    text = text.strip()
-
-    # Method 1: Try to parse the entire response
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
-
-    # Method 2: Find JSON block between ```json and ```
-    json_block_match = re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL)
-    if json_block_match:
-        try:
-            return json.loads(json_block_match.group(1))
-        except json.JSONDecodeError:
-            pass
-
-    # Method 3: Find the outermost { } pair
-    # Count braces to find matching pair
-    start_idx = text.find('{')
-    if start_idx != -1:
-        brace_count = 0
-        end_idx = -1
-        in_string = False
-        escape_next = False
-
-        for i in range(start_idx, len(text)):
-            char = text[i]
-
-            if escape_next:
-                escape_next = False
-                continue
-
-            if char == '\\':
-                escape_next = True
-                continue
-
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-
-            if not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end_idx = i
-                        break
-
-        if end_idx != -1:
-            json_str = text[start_idx:end_idx + 1]
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                # Try to fix common issues
-                # Remove trailing commas before } or ]
-                json_str = re.sub(r',\s*([}\]])', r'\1', json_str)
-                # Replace single quotes with double quotes (careful with apostrophes)
-                try:
-                    return json.loads(json_str)
-                except json.JSONDecodeError:
-                    pass
-
-    # Method 4: Simplest regex match (last resort)
-    match = re.search(r'\{[^{}]*\}', text)
-    if match:
-        try:
-            return json.loads(match.group())
-        except json.JSONDecodeError:
-            pass
-
-    return None
+    return parse_llm_json(text.strip())
 
 
 class RefinementAgent:
@@ -173,20 +112,10 @@ class RefinementAgent:
         request_lower = request.lower()
 
         # First, try keyword-based classification (faster, more reliable for small models)
-        if any(word in request_lower for word in ["explain", "explain", "what", "how", "why", "describe", "tell me", "show me"]):
-            return "explain"
-
-        if any(word in request_lower for word in ["add", "create", "new", "implement", "build", "write"]):
-            return "add"
-
-        if any(word in request_lower for word in ["fix", "bug", "broken", "error", "issue", "problem"]):
-            return "fix"
-
-        if any(word in request_lower for word in ["optimize", "faster", "efficient", "speed", "performance", "improve", "better"]):
-            return "optimize"
-
-        if any(word in request_lower for word in ["refactor", "restructure", "organize", "clean", "rewrite", "redesign"]):
-            return "refactor"
+        for category, keywords in _REQUEST_KEYWORDS:
+            for keyword in keywords:
+                if keyword in request_lower:
+                    return category
 
         # Fallback to LLM classification if keywords don't match
         prompt = f"""Classify this code change request into ONE category (lowercase):
@@ -243,7 +172,7 @@ Return ONLY the JSON array, nothing else."""
             import re
             match = re.search(r'\[.*\]', response, re.DOTALL)
             if match:
-                return json.loads(match.group())
+                return json_loads(match.group())
         except Exception:
             pass
 
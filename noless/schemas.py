@@ -1,7 +1,7 @@
 """Pydantic schemas for type-safe validation across NoLess components."""
 
 from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CodeIssue(BaseModel):
@@ -32,31 +32,30 @@ class CodeReviewResult(BaseModel):
     improved_code: Optional[str] = Field(None, description="AI-improved version of the code")
     summary: str = Field(default="", description="Summary of the review")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "valid": True,
-                "issues": [
-                    {
-                        "severity": "warning",
-                        "message": "Missing error handling",
-                        "line": 42,
-                        "category": "error-handling",
-                        "suggestion": "Wrap in try-except block"
-                    }
-                ],
-                "suggestions": [
-                    {
-                        "title": "Add type hints",
-                        "description": "Function parameters lack type hints",
-                        "type": "best-practice",
-                        "priority": "medium"
-                    }
-                ],
-                "improved_code": None,
-                "summary": "Code has 1 warning and 1 suggestion"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "valid": True,
+            "issues": [
+                {
+                    "severity": "warning",
+                    "message": "Missing error handling",
+                    "line": 42,
+                    "category": "error-handling",
+                    "suggestion": "Wrap in try-except block"
+                }
+            ],
+            "suggestions": [
+                {
+                    "title": "Add type hints",
+                    "description": "Function parameters lack type hints",
+                    "type": "best-practice",
+                    "priority": "medium"
+                }
+            ],
+            "improved_code": None,
+            "summary": "Code has 1 warning and 1 suggestion"
         }
+    })
 
 
 class DatasetMetadata(BaseModel):
@@ -15,6 +15,12 @@ from noless.ollama_client import OllamaClient
 console = Console()
 
 
+def _pause(seconds: float) -> None:
+    """Animation delay; skipped when output isn't a terminal (pipes, CI logs)."""
+    if console.is_terminal:
+        time.sleep(seconds)
+
+
 def show_startup_sequence():
     """Display the NoLess startup sequence with service connections"""
 
@@ -43,10 +49,10 @@ def _animate_banner():
 
     for line in banner_lines:
         console.print(line, style="bold cyan", justify="center")
-        time.sleep(0.01)  # Much faster!
+        _pause(0.01)  # Much faster!
 
     console.print("\n")
-    time.sleep(0.1)
+    _pause(0.1)
 
 
 def _show_system_init():
@@ -67,11 +73,11 @@ def _show_system_init():
 
     for step, duration in init_steps:
         with console.status(f"[cyan]{step}...", spinner="dots"):
-            time.sleep(duration)
+            _pause(duration)
         console.print(f"[green]✓[/green] {step}")
 
     console.print()
-    time.sleep(0.05)
+    _pause(0.05)
 
 
 def _connect_to_services():
@@ -156,7 +162,7 @@ def _connect_to_services():
                 )
 
             live.update(table)
-            time.sleep(service["delay"])
+            _pause(service["delay"])
 
             # Check the service
             status, details = service["check_func"]()
@@ -180,7 +186,7 @@ def _connect_to_services():
     console.print()
     console.print(final_table)
     console.print()
-    time.sleep(0.05)  # Faster!
+    _pause(0.05)  # Faster!
 
 
 def _check_ollama():
@@ -213,7 +219,7 @@ def _show_ready_message():
         # Fast batch updates
         for i in range(0, 100, 10):
             progress.advance(task, 10)
-            time.sleep(0.005)
+            _pause(0.005)
 
     console.print()
 
@@ -274,7 +280,7 @@ def show_quick_startup():
     console.print()
 
     with console.status("[cyan]Initializing NoLess...", spinner="dots"):
-        time.sleep(0.5)
+        _pause(0.5)
 
     console.print("[green]✓[/green] NoLess ready!\n")
 
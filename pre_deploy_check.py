@@ -3,33 +3,65 @@
 Pre-deployment checks for NoLess package
 Run this before committing a new release
 """
+import re
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
+_RE_INIT_VERSION = re.compile(r'__version__\s*=\s*["\']([^"\']+)["\']')
+_RE_SETUP_VERSION = re.compile(r'version="([^"]+)"')
 
-def run_command(cmd, description):
-    """Run a command and return success status"""
+
+def start_command(cmd):
+    """Launch a command (argument list) without a shell, its output piped back"""
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+        bufsize=1
+    )
+
+
+def start_background(cmd):
+    """Launch a command (argument list) with its output spooled to a temp file
+
+    Nothing reads the output until it's reported, so a pipe would fill up
+    and stall the command; the file lets it run to completion meanwhile.
+    """
+    log = tempfile.TemporaryFile(mode="w+", errors="replace")
+    process = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT)
+    return process, log
+
+
+def run_command(cmd, description, background=None):
+    """Run a command (argument list), streaming its output, and return success status
+
+    Pass the result of start_background() to report on a command that was
+    launched earlier; its output is replayed once it exits.
+    """
     print(f"\n{'='*60}")
     print(f"🔍 {description}")
     print(f"{'='*60}")
     
     try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        
-        if result.stdout:
-            print(result.stdout)
+        if background:
+            process, log = background
+            with log:
+                process.wait()
+                log.seek(0)
+                for line in log:
+                    print(line, end="")
+        else:
+            # Output is echoed as it arrives rather than after exit
+            with start_command(cmd) as process:
+                for line in process.stdout:
+                    print(line, end="")
         
-        if result.returncode != 0:
+        if process.returncode != 0:
             print(f"❌ FAILED: {description}")
-            if result.stderr:
-                print(result.stderr)
             return False
         
         print(f"✅ PASSED: {description}")
@@ -53,9 +85,8 @@ def check_version_sync():
         init_content = init_file.read_text()
         setup_content = setup_file.read_text()
         
-        import re
-        init_version = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', init_content)
-        setup_version = re.search(r'version="([^"]+)"', setup_content)
+        init_version = _RE_INIT_VERSION.search(init_content)
+        setup_version = _RE_SETUP_VERSION.search(setup_content)
         
         if not init_version or not setup_version:
             print("❌ Could not find version strings")
@@ -89,27 +120,29 @@ def main():
     # Check version synchronization
     checks.append(check_version_sync())
     
-    # Run tests
-    checks.append(run_command(
-        "python -m unittest discover -s tests",
-        "Running unit tests"
-    ))
-    
     # Check if dist directory should be cleaned
     if Path("dist").exists():
         print("\n⚠️  Warning: dist/ directory exists. Clean it before building:")
         print("   Remove-Item -Recurse -Force dist")
     
-    # Try to build
+    # The build doesn't depend on the tests, so start it now and report it
+    # once they finish; only twine has to wait for its output
+    build_cmd = [sys.executable, "-m", "build"]
+    build = start_background(build_cmd)
+    
+    # Run tests
     checks.append(run_command(
-        "python -m build",
-        "Building package"
+        [sys.executable, "-m", "unittest", "discover", "-s", "tests"],
+        "Running unit tests"
     ))
     
+    # Try to build
+    checks.append(run_command(build_cmd, "Building package", background=build))
+    
     # Check built packages
     if Path("dist").exists():
         checks.append(run_command(
-            "twine check dist/*",
+            ["twine", "check", *sorted(str(path) for path in Path("dist").glob("*"))],
             "Validating package with twine"
         ))
     
@@ -13,8 +13,7 @@ BASE_REQUIREMENTS = [
     "openml>=0.14.0",
     "questionary>=2.0.0",
     "prompt_toolkit>=3.0.0",
-    "colorama>=0.4.6",
-    "pyfiglet>=1.0.0",
+    "pydantic>=2.0.0",
 ]
 
 ML_REQUIREMENTS = [
@@ -35,6 +34,12 @@ LLM_REQUIREMENTS = [
     "openai>=1.0.0",
 ]
 
+# Native accelerators picked up automatically at runtime when installed
+SPEEDUP_REQUIREMENTS = [
+    "orjson>=3.8.0",
+    "hyperscan>=0.7.0",
+]
+
 ALL_EXTRAS = sorted({
     *ML_REQUIREMENTS,
     *DATA_REQUIREMENTS,
@@ -76,6 +81,7 @@ setup(
         "ml": ML_REQUIREMENTS,
         "data": DATA_REQUIREMENTS,
         "llm": LLM_REQUIREMENTS,
+        "speedups": SPEEDUP_REQUIREMENTS,
         "all": ALL_EXTRAS,
     },
     entry_points={
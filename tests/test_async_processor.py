@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from noless import async_processor
+from noless.async_processor import AsyncProcessor, ParallelLLMProcessor, RateLimiter
+
+
+async def _double_or_fail(x):
+    await asyncio.sleep(0)
+    if x % 2:
+        raise ValueError(x)
+    return x * 2
+
+
+class AsyncProcessorTests(unittest.TestCase):
+    def setUp(self):
+        self.processor = AsyncProcessor(max_workers=2)
+
+    def tearDown(self):
+        self.processor.shutdown()
+
+    def test_batch_async_splits_results_and_errors(self):
+        results, errors = asyncio.run(
+            self.processor.batch_async(_double_or_fail, [0, 1, 2, 3], batch_size=2)
+        )
+        self.assertEqual([0, None, 4, None], results)
+        self.assertEqual([1, 3], [index for index, _ in errors])
+        self.assertTrue(all(isinstance(exc, ValueError) for _, exc in errors))
+
+    def test_run_sync_inside_running_loop(self):
+        async def caller():
+            return self.processor.run_sync(_double_or_fail, 4)
+
+        self.assertEqual(8, self.processor.run_sync(_double_or_fail, 4))
+        self.assertEqual(8, asyncio.run(caller()))
+
+    def test_first_processor_sizes_shared_executor(self):
+        with mock.patch.object(async_processor, "_default_executor", None):
+            first = AsyncProcessor(max_workers=3)
+            second = AsyncProcessor(max_workers=7)
+            self.assertIs(first.executor, second.executor)
+            self.assertEqual(3, first.executor._max_workers)
+            first.executor.shutdown()
+
+
+class _EchoClient:
+    def generate(self, model, prompt, system=None, temperature=0.2):
+        return prompt
+
+
+class ParallelLLMProcessorTests(unittest.TestCase):
+    def test_processor_reused_across_event_loops(self):
+        processor = ParallelLLMProcessor(_EchoClient(), max_concurrent=1)
+        processor.rate_limiter = RateLimiter(calls_per_second=1000)
+        for _ in range(2):
+            results, errors = asyncio.run(processor.generate_multiple("m", ["a", "b", "c"]))
+            self.assertEqual(["a", "b", "c"], results)
+            self.assertEqual([], errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+
+from noless.cache_manager import CacheManager
+
+
+class CacheManagerTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = CacheManager(cache_dir=self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_set_many_writes_all_rows(self):
+        written = self.cache.set_many([
+            ("a", {"n": 1}, "dataset"),
+            ("b", [1, 2, 3], "llm"),
+        ])
+        self.assertEqual(2, written)
+        self.assertEqual({"n": 1}, self.cache.get("a"))
+        self.assertEqual([1, 2, 3], self.cache.get("b"))
+        self.assertEqual({"dataset": 1, "llm": 1}, self.cache.get_stats()["by_category"])
+
+    def test_memory_layer_returns_fresh_copies(self):
+        self.cache.set("k", {"items": [1]})
+        first = self.cache.get("k")
+        first["items"].append(2)
+        self.assertEqual({"items": [1]}, self.cache.get("k"))
+
+    def test_invalidate_flushes_memory_layer(self):
+        self.cache.set("k", "v", category="llm")
+        self.assertEqual("v", self.cache.get("k"))
+        self.cache.invalidate(category="llm")
+        self.assertIsNone(self.cache.get("k"))
+
+    def test_invalidate_prefix_pattern(self):
+        self.cache.set_many([
+            ("llm:a", 1, "llm"),
+            ("llm:b", 2, "llm"),
+            ("lln:c", 3, "llm"),
+        ])
+        self.assertEqual(2, self.cache.invalidate(pattern="llm:%"))
+        self.assertIsNone(self.cache.get("llm:a"))
+        self.assertEqual(3, self.cache.get("lln:c"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
+import json
+import time
 import unittest
 
 from noless.code_validator import CodeValidator
@@ -11,6 +13,30 @@ class FakeOllamaClient:
         return self._models
 
 
+class ReviewingOllamaClient(FakeOllamaClient):
+    def __init__(self, models):
+        super().__init__(models)
+        self.reviews = 0
+
+    def generate(self, model, prompt, **kwargs):
+        time.sleep(0.05)
+        return json.dumps({"valid": True, "issues": [], "suggestions": ["ok"]})
+
+    def generate_stream(self, model, prompt, **kwargs):
+        self.reviews += 1
+        yield self.generate(model, prompt, **kwargs)
+
+
+class GenerateOnlyOllamaClient(FakeOllamaClient):
+    def __init__(self, models):
+        super().__init__(models)
+        self.reviews = 0
+
+    def generate(self, model, prompt, **kwargs):
+        self.reviews += 1
+        return json.dumps({"valid": True, "issues": [], "suggestions": ["rename x"]})
+
+
 class CodeValidatorTests(unittest.TestCase):
     def test_uses_requested_reviewer_when_available(self):
         client = FakeOllamaClient(["deepseek-coder:6.7b", "mixtral:8x7b"])
@@ -39,6 +65,54 @@ class CodeValidatorTests(unittest.TestCase):
         )
         self.assertEqual("mixtral:8x7b", validator.reviewer_model)
 
+    def test_robust_json_parse_skips_braces_inside_strings(self):
+        client = FakeOllamaClient(["deepseek-coder:6.7b"])
+        validator = CodeValidator(generation_model="deepseek-coder:6.7b", ollama_client=client)
+        text = 'Review: {"issues": ["unbalanced \\"}\\" in f-string {x"], "valid": false,} done'
+        self.assertEqual(
+            {"issues": ['unbalanced "}" in f-string {x'], "valid": False},
+            validator._robust_json_parse(text),
+        )
+
+    def test_robust_json_parse_returns_fresh_copies(self):
+        client = FakeOllamaClient(["deepseek-coder:6.7b"])
+        validator = CodeValidator(generation_model="deepseek-coder:6.7b", ollama_client=client)
+        first = validator._robust_json_parse('{"issues": ["a"]}')
+        first["issues"].append("b")
+        self.assertEqual({"issues": ["a"]}, validator._robust_json_parse('{"issues": ["a"]}'))
+
+    def test_identical_concurrent_reviews_share_one_request(self):
+        client = ReviewingOllamaClient(["deepseek-coder:6.7b"])
+        validator = CodeValidator(
+            generation_model="deepseek-coder:6.7b",
+            ollama_client=client,
+            enable_caching=False,
+            enable_metrics=False,
+            enable_error_detection=False,
+        )
+        code = "x = 1\n"
+        results = validator.validate_many([(code, "a.py", {}), (code, "a.py", {})])
+
+        self.assertEqual(1, client.reviews)
+        self.assertEqual(results[0], results[1])
+        self.assertIsNot(results[0], results[1])
+
+    def test_review_with_generate_only_client(self):
+        client = GenerateOnlyOllamaClient(["deepseek-coder:6.7b"])
+        validator = CodeValidator(
+            generation_model="deepseek-coder:6.7b",
+            ollama_client=client,
+            enable_caching=False,
+            enable_metrics=False,
+            enable_error_detection=False,
+        )
+        result = validator.validate_and_improve("x = 1\n", "a.py", {})
+
+        self.assertEqual(1, client.reviews)
+        self.assertEqual(["rename x"], result["suggestions"])
+        self.assertEqual(["rename x"], validator.quick_validate("y = 2\n", "b.py", {})["suggestions"])
+        self.assertEqual(2, client.reviews)
+
 
 if __name__ == "__main__":
     unittest.main()
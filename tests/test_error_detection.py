@@ -0,0 +1,115 @@
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+from noless.error_detection import ErrorDetector, PerformanceAnalyzer, SecurityAnalyzer
+
+
+def _types(issues):
+    return [issue.type for issue in issues]
+
+
+class PerformanceAnalyzerTests(unittest.TestCase):
+    def test_list_mutation_in_nested_loops_reported_once(self):
+        code = "for a in x:\n    for b in a:\n        out.append(b)\n"
+        issues = PerformanceAnalyzer().analyze(code)
+        self.assertEqual(["inefficient_loop"], _types(issues))
+
+    def test_list_mutations_in_separate_loops_each_reported(self):
+        code = (
+            "def f(x):\n    for a in x:\n        out.append(a)\n        out.insert(0, a)\n"
+            "def g(x):\n    for a in x:\n        out.append(a)\n"
+        )
+        issues = PerformanceAnalyzer().analyze(code)
+        self.assertEqual(["inefficient_loop"] * 3, _types(issues))
+
+    def test_string_concat_in_loop_header_not_reported(self):
+        issues = PerformanceAnalyzer().analyze('for c in "ab" + "cd":\n    print(c)\n')
+        self.assertNotIn("string_concat", _types(issues))
+
+    def test_string_concat_in_loop_body_reported_per_line(self):
+        code = (
+            's = ""\ntotal = 0\n'
+            "for x in items:\n"
+            "    s += x\n"
+            '    s = s + "a"\n'
+            "    total += x\n"
+        )
+        issues = PerformanceAnalyzer().analyze(code)
+        self.assertEqual(["string_concat", "string_concat"], _types(issues))
+
+    def test_overlapping_secret_patterns_report_line_once(self):
+        issues = SecurityAnalyzer().analyze('api_key = "x"; token = "y"\nsecret = "z"\n')
+        self.assertEqual(
+            [("hardcoded_secret", 1), ("hardcoded_secret", 2)],
+            [(issue.type, issue.line) for issue in issues],
+        )
+
+    def test_deep_nesting_counts_blocks_not_elif_chains(self):
+        deep = (
+            "def f(x):\n"
+            "    for a in x:\n"
+            "        if a:\n"
+            "            while a:\n"
+            "                with a:\n"
+            "                    try:\n"
+            "                        pass\n"
+            "                    except Exception:\n"
+            "                        pass\n"
+        )
+        flat = "def g(x):\n" + "".join(
+            f"    {'if' if i == 0 else 'elif'} x == {i}:\n        return {i}\n" for i in range(8)
+        )
+        issues = PerformanceAnalyzer().analyze(deep + flat)
+        nesting = [issue for issue in issues if issue.type == "deep_nesting"]
+        self.assertEqual(["f"], [issue.location for issue in nesting])
+        self.assertIn("(5)", nesting[0].message)
+
+    def test_deep_nesting_reported_for_each_same_named_method(self):
+        body = "".join(f"{'    ' * (depth + 2)}if x:\n" for depth in range(5)) + " " * 28 + "pass\n"
+        code = "".join(f"class {name}:\n    def run(self, x):\n{body}" for name in "AB")
+        issues = PerformanceAnalyzer().analyze(code)
+        self.assertEqual(["run", "run"], [issue.location for issue in issues if issue.type == "deep_nesting"])
+
+
+class ErrorDetectorTests(unittest.TestCase):
+    def test_analyze_many_matches_analyze_in_order(self):
+        detector = ErrorDetector()
+        codes = ['password = "x"\n', "for a in x:\n    out.append(a)\n", "assert ok\n"]
+        self.assertEqual([detector.analyze(code) for code in codes], detector.analyze_many(codes))
+
+    def test_analyze_many_falls_back_when_pool_is_broken(self):
+        detector = ErrorDetector()
+        codes = ['password = "x"\n', "assert ok\n"]
+        pool = mock.Mock()
+        pool.map.side_effect = BrokenProcessPool()
+        with mock.patch("noless.async_processor.get_process_pool", return_value=pool):
+            self.assertEqual([detector.analyze(code) for code in codes], detector.analyze_many(codes))
+
+    def test_repeated_analyze_returns_fresh_lists(self):
+        code = 'api_key = "x"\n'
+        first = ErrorDetector().analyze(code)
+        first["security_issues"].clear()
+        second = ErrorDetector().analyze(code)
+        self.assertEqual(["hardcoded_secret"], [issue.type for issue in second["security_issues"]])
+
+    def test_repeated_analyze_returns_fresh_issues(self):
+        code = 'token = "x"\n'
+        ErrorDetector().analyze(code)["security_issues"][0].severity = "low"
+        second = ErrorDetector().analyze(code)
+        self.assertEqual("critical", second["security_issues"][0].severity)
+
+    def test_swapped_analyzer_bypasses_shared_cache(self):
+        class NoSecrets(SecurityAnalyzer):
+            def analyze(self, code, tree=None):
+                return []
+
+        code = 'secret = "x"\n'
+        ErrorDetector().analyze(code)
+        detector = ErrorDetector()
+        detector.security_analyzer = NoSecrets()
+        self.assertEqual([], detector.analyze(code)["security_issues"])
+
+
+if __name__ == "__main__":
+    unittest.main()